@@ -1,14 +1,47 @@
-"""DnC abstraction."""
+"""DnC abstraction.
+
+`divide_and_conquer` combines pairs level by level through a `starmap`
+hook, so a process pool pickles both halves of every merge, at every
+level. `parallel_divide_and_conquer` splits the input into one chunk per
+worker instead: workers solve a whole chunk each (numeric chunks are read
+off a `multiprocessing.shared_memory` buffer rather than pickled), and
+only the top log(P) merges happen in the parent.
+
+Types that can merge many operands at once (`SupportsKMerge`) can be
+combined k at a time instead of pairwise, which cuts the number of passes
+over the data from log2(N) to log_k(N).
+"""
 import abc
 import itertools
+import os
+import sys
+import threading
+from array import array
+from multiprocessing import Pool, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 from operator import add
-from typing import Callable, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Sized,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
-from more_itertools import grouper
+from more_itertools import chunked, grouper
 
 A = TypeVar("A")
+X = TypeVar("X")
 _T = TypeVar("_T", bound="SupportsMerge")
 
+Leaf = Callable[[List[X]], _T]
+_ATTACH_LOCK = threading.Lock()
+
 
 class SupportsMerge(Generic[A], metaclass=abc.ABCMeta):
     @abc.abstractmethod
@@ -16,10 +49,151 @@ class SupportsMerge(Generic[A], metaclass=abc.ABCMeta):
         pass
 
 
+class SupportsKMerge(SupportsMerge[A]):
+    @abc.abstractmethod
+    def merge(self, *others: A) -> A:
+        pass
+
+
 def divide_and_conquer(
     ys: List[_T],
     starmap: Callable = itertools.starmap,
+    k: int = 2,
 ) -> List[_T]:
+    """Combine ys pairwise, or k at a time for `SupportsKMerge` types."""
+    assert k >= 2, f"k should be at least 2, got {k}"
     while len(ys) > 1:
-        ys = list(starmap(add, grouper(ys, 2)))
+        if k == 2:
+            ys = list(starmap(add, grouper(ys, 2)))
+        else:
+            ys = list(starmap(_merge_k, chunked(ys, k)))
     return ys
+
+
+def _merge_k(y: "SupportsKMerge[A]", *others: A) -> A:
+    return y.merge(*others)
+
+
+def dnc_leaf(pure: Callable[[X], _T], chunk: List[X]) -> _T:
+    """Solve a chunk serially, e.g. `partial(dnc_leaf, InvCount.pure)`."""
+    return divide_and_conquer(list(map(pure, chunk)))[0]
+
+
+def parallel_divide_and_conquer(
+    xs: Sequence[X],
+    leaf: Leaf[X, _T],
+    chunks: Optional[int] = None,
+    map_: Optional[Callable] = None,
+    k: int = 2,
+) -> List[_T]:
+    """Solve one chunk per worker with `leaf`, then merge the P results.
+
+    The P results of `solve_chunks` get combined through
+    `divide_and_conquer(..., k=k)`, so `SupportsKMerge` types can be
+    merged in a single pass with k=P.
+    """
+    return divide_and_conquer(solve_chunks(xs, leaf, chunks, map_), k=k)
+
+
+def solve_chunks(
+    xs: Sequence[X],
+    leaf: Leaf[X, _T],
+    chunks: Optional[int] = None,
+    map_: Optional[Callable] = None,
+) -> List[_T]:
+    """Split xs into P chunks and solve each one with `leaf`, in order.
+
+    `leaf` has to be picklable (a module-level function or a partial of
+    one). Pass e.g. `pool.map` as map_ to reuse a pool; by default one
+    with a process per chunk gets spun up. Sequences of ints (fitting in
+    64 bits) or floats are shared with the workers rather than pickled.
+    """
+    if not xs:
+        return []
+
+    chunks = min(chunks or os.cpu_count() or 1, len(xs))
+    bounds = [len(xs) * i // chunks for i in range(chunks + 1)]
+    spans = list(zip(bounds, bounds[1:]))
+
+    if map_ is None:
+        with Pool(chunks) as pool:
+            return _run_chunks(xs, leaf, spans, pool.map)
+    return _run_chunks(xs, leaf, spans, map_)
+
+
+def _run_chunks(
+    xs: Sequence[X],
+    leaf: Leaf[X, _T],
+    spans: List[Tuple[int, int]],
+    map_: Callable,
+) -> List[_T]:
+    if (typecode := typecode_of(xs)) is None:
+        return list(map_(leaf, (list(xs[lo:hi]) for lo, hi in spans)))
+
+    _arr = array(typecode, cast(Sequence[Any], xs))
+    _bytes = memoryview(_arr).cast("B")
+    shm = SharedMemory(create=True, size=max(len(_bytes), 1))
+    try:
+        assert shm.buf is not None
+        shm.buf[: len(_bytes)] = _bytes
+        _bytes.release()
+        del _arr
+        tasks = [(shm.name, typecode, lo, hi, leaf) for lo, hi in spans]
+        return list(map_(_shm_leaf, tasks))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _shm_leaf(task: Tuple[str, str, int, int, Leaf[X, _T]]) -> _T:
+    name, typecode, lo, hi, leaf = task
+    shm = _attach(name)
+    try:
+        assert shm.buf is not None
+        chunk = array(typecode)
+        chunk.frombytes(shm.buf[lo * chunk.itemsize : hi * chunk.itemsize])
+    finally:
+        shm.close()
+    return leaf(cast(List[X], chunk.tolist()))
+
+
+def _attach(shm_name: str) -> SharedMemory:
+    """Attach to a buffer of the parent's without tracking it.
+
+    The parent owns the buffer; before 3.13, attaching registers it with
+    the resource tracker all the same, and a tracker of the worker's own
+    then reports it leaked, or a tracker shared with the parent forgets
+    it. So registration gets skipped for that one name.
+    """
+    if sys.version_info >= (3, 13):
+        # pylint:disable-next=unexpected-keyword-arg
+        return SharedMemory(name=shm_name, track=False)
+
+    register = resource_tracker.register
+
+    def _register(name: Sized, rtype: str) -> None:
+        if rtype != "shared_memory" or str(name).lstrip("/") != shm_name:
+            register(name, rtype)
+
+    with _ATTACH_LOCK:
+        resource_tracker.register = _register
+        try:
+            return SharedMemory(name=shm_name)
+        finally:
+            resource_tracker.register = register
+
+
+def typecode_of(xs: Sequence) -> Optional[str]:
+    """Pick an array typecode fitting every element of xs, if any."""
+    if not xs:
+        return None
+    if isinstance(xs, array) and xs.typecode in "qd":
+        return xs.typecode
+    # exact types: bools or float subclasses wouldn't come back as such
+    # pylint:disable=unidiomatic-typecheck
+    if all(type(x) is int for x in xs):
+        if -(1 << 63) <= min(xs) and max(xs) < 1 << 63:
+            return "q"
+    elif all(type(x) is float for x in xs):
+        return "d"
+    return None
@@ -0,0 +1,7 @@
+"""Structural types shared by the sorting and counting modules."""
+from typing import Any, Protocol
+
+
+class SupportsLessThan(Protocol):
+    def __lt__(self, __other: Any) -> bool:
+        ...
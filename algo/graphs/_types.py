@@ -1,8 +1,11 @@
-"""Common models for graph primitives."""
-import math
+"""Common models for graph primitives.
+
+Graphs are never mutated by traversals: visit state (colors, distances,
+leaders) lives in a per-run `Traversal`, so one loaded graph can serve
+any number of (concurrent) traversals without copying or resetting.
+"""
 from collections import defaultdict
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Dict, Generic, List, Optional, Set, Tuple, TypeVar
 
@@ -16,16 +19,22 @@ class Color(Enum):
     BLACK = auto()
 
 
-@dataclass
+@dataclass(frozen=True)
 class Vertex(Generic[X]):
     name: X
-    color: Color = Color.WHITE
-    dist: float = math.inf
-    leader: Optional[X] = None
 
-    @property
-    def seen(self) -> bool:
-        return self.color != Color.WHITE
+
+@dataclass
+class Traversal(Generic[X]):
+    """Visit state of one traversal run; unseen vertices are absent."""
+
+    color: Dict[X, Color] = field(default_factory=dict)
+    dist: Dict[X, float] = field(default_factory=dict)
+    leader: Dict[X, Optional[X]] = field(default_factory=dict)
+    fin: List[X] = field(default_factory=list)
+
+    def seen(self, v_name: X) -> bool:
+        return self.color.get(v_name, Color.WHITE) != Color.WHITE
 
 
 Adjacency = Set[Vertex]
@@ -60,5 +69,5 @@ class Graph(Generic[X]):
             _rev_edges[v_name].add(u_name)
         return (
             cls(vertices=_vertices, edges=_edges),
-            cls(vertices=deepcopy(_vertices), edges=_rev_edges),
+            cls(vertices=_vertices, edges=_rev_edges),
         )
@@ -1,42 +1,76 @@
 """Breadth-first graph exploration primitive.
 """
+from array import array
 from collections import deque
-from typing import Iterable
+from typing import Dict, Iterable, Optional
 
 from devtools import debug
 
-from ._types import Color, Graph, X
+from ._types import Color, Graph, Traversal, X
+from .csr import CSRGraph
+from .union_find import UnionFind
 
 
-def bfs(g: Graph, s_name: X) -> None:
-    s = g.vertices[s_name]
-    s.color = Color.BLACK
-    s.dist = 0
-    s.leader = s_name
+def bfs(
+    g: Graph, s_name: X, state: Optional[Traversal[X]] = None
+) -> Traversal[X]:
+    """Explore G from s, recording visits into state (or a fresh one)."""
+    state = Traversal() if state is None else state
+    color, dist, leader = state.color, state.dist, state.leader
+
+    color[s_name] = Color.BLACK
+    dist[s_name] = 0
+    leader[s_name] = s_name
 
     q = deque([s_name])
     while q:
-        v = g.vertices[q.popleft()]
-        for w_name in g.edges[v.name]:
-            if not (w := g.vertices[w_name]).seen:
-                w.color = Color.BLACK
-                w.dist = v.dist + 1
-                w.leader = s_name
+        v_name = q.popleft()
+        for w_name in g.edges[v_name]:
+            if w_name not in color:
+                color[w_name] = Color.BLACK
+                dist[w_name] = dist[v_name] + 1
+                leader[w_name] = s_name
                 q.append(w_name)
+    return state
+
+
+def bfs_csr(g: CSRGraph[X], s_name: X) -> "array[int]":
+    """Return hop distances from s by dense vertex id, -1 if unreachable."""
+    offsets, targets = g.offsets, g.targets
+    dist = array("q", [-1]) * len(g)
+    dist[s := g.ids[s_name]] = 0
+
+    q = deque([s])
+    while q:
+        v = q.popleft()
+        w_dist = dist[v] + 1
+        for w in targets[offsets[v] : offsets[v + 1]]:
+            if dist[w] < 0:
+                dist[w] = w_dist
+                q.append(w)
+    return dist
 
 
 def connected_comps(g: Graph) -> Iterable[Graph]:
-    for v in g.vertices.values():
-        if not v.seen:
-            bfs(g, v.name)
+    """Yield the connected components of an undirected G.
+
+    One union-find pass over the edges labels every vertex, then vertices
+    and edges get bucketed by label in a single sweep each.
+    """
+    ids = {v_name: i for i, v_name in enumerate(g.vertices)}
+    uf = UnionFind.from_edges(
+        len(ids),
+        ((ids[u], ids[v]) for u, adj in g.edges.items() for v in adj),
+    )
 
-    comps = {_.leader for _ in g.vertices.values()}
-    for comp in sorted(comps):
-        vertices = {k: v for k, v in g.vertices.items() if v.leader == comp}
-        yield Graph(
-            vertices=vertices,
-            edges={v: adj for v, adj in g.edges.items() if v in vertices},
-        )
+    labels = uf.labels()
+    comps: Dict[int, Graph] = {}
+    for v_name, v in g.vertices.items():
+        comp = comps.setdefault(labels[ids[v_name]], Graph({}, {}))
+        comp.vertices[v_name] = v
+    for v_name, adj in g.edges.items():
+        comps[labels[ids[v_name]]].edges[v_name] = adj
+    yield from comps.values()
 
 
 if __name__ == "__main__":
@@ -54,6 +88,4 @@ if __name__ == "__main__":
 
     _comps = list(connected_comps(_graph))
     debug(len(_comps))
-
-    assert all(v.seen for v in _graph.vertices.values())
     debug(_comps)
@@ -0,0 +1,165 @@
+"""Compressed sparse row (CSR) graph representation.
+
+Vertex names get interned to dense ids 0..n-1, and the out-edges of
+vertex v live in targets[offsets[v]:offsets[v + 1]], with their weights
+(if any) at the same positions in weights. That's three flat arrays in
+total, instead of a Vertex, a dict entry and a set per vertex.
+
+The graph is immutable: traversals keep their state in per-run arrays
+indexed by dense id (see `bfs_csr`, `find_sccs_csr` and `dijsktra_csr`).
+"""
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate, chain, repeat
+from typing import (
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ._types import AdjacencyRow, Graph, X
+
+
+@dataclass(frozen=True)
+class CSRGraph(Generic[X]):
+    names: List[X]  # dense id -> name
+    ids: Dict[X, int]  # name -> dense id
+    offsets: "array[int]"
+    targets: "array[int]"
+    weights: Optional["array[float]"] = None
+
+    @classmethod
+    def from_adj_l(cls, adj_l: Iterable[AdjacencyRow]) -> "CSRGraph[X]":
+        builder: CSRBuilder[X] = CSRBuilder()
+        for s, *adj in adj_l:
+            builder.add_vertex(s)
+            for v in adj:
+                builder.add_edge(s, v)
+        return builder.build()
+
+    @classmethod
+    def from_edges(cls, edge_l: Iterable[Tuple[X, X]]) -> "CSRGraph[X]":
+        return cls._build(edge_l)
+
+    @classmethod
+    def from_graph(cls, g: Graph[X]) -> "CSRGraph[X]":
+        return cls._build(
+            ((u, v) for u, adj in g.edges.items() for v in adj),
+            vertices=g.vertices,
+        )
+
+    @classmethod
+    def from_dijkstra(
+        cls, g: Mapping[X, Iterable[Tuple[X, X, float]]]
+    ) -> "CSRGraph[X]":
+        """Convert `algo.graphs.dijkstra.Graph` edge lists."""
+        return cls._build(
+            chain.from_iterable(g.values()), vertices=g, weighted=True
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def neighbours(self, v: int) -> "array[int]":
+        return self.targets[self.offsets[v] : self.offsets[v + 1]]
+
+    def reverse(self) -> "CSRGraph[X]":
+        """Return the graph with every edge flipped, sharing the names."""
+        offsets = self.offsets
+        heads = array(
+            "q",
+            chain.from_iterable(
+                repeat(v, offsets[v + 1] - offsets[v])
+                for v in range(len(self))
+            ),
+        )
+        return self.from_arrays(
+            self.names, self.ids, self.targets, heads, self.weights
+        )
+
+    @classmethod
+    def _build(
+        cls,
+        edge_l: Iterable[Sequence],
+        vertices: Iterable[X] = (),
+        weighted: bool = False,
+    ) -> "CSRGraph[X]":
+        builder: CSRBuilder[X] = CSRBuilder(weighted=weighted)
+        for name in vertices:
+            builder.add_vertex(name)
+        for edge in edge_l:
+            builder.add_edge(*edge)
+        return builder.build()
+
+    @classmethod
+    def from_arrays(
+        cls,
+        names: List[X],
+        ids: Dict[X, int],
+        heads: "array[int]",
+        tails: "array[int]",
+        weights: Optional["array[float]"],
+    ) -> "CSRGraph[X]":
+        """Build from already interned (head, tail, weight) edge columns."""
+        # counting sort of the edges by head
+        degrees = array("q", bytes(8 * (len(names) + 1)))
+        for h in heads:
+            degrees[h + 1] += 1
+        offsets = array("q", accumulate(degrees))
+
+        _free = offsets[:-1]  # next free slot of every vertex
+        targets = array("q", bytes(8 * len(tails)))
+        _weights = None if weights is None else array("d", targets)
+        for i, h in enumerate(heads):
+            j = _free[h]
+            _free[h] = j + 1
+            targets[j] = tails[i]
+            if _weights is not None and weights is not None:
+                _weights[j] = weights[i]
+
+        return cls(names, ids, offsets, targets, _weights)
+
+
+class CSRBuilder(Generic[X]):
+    """Accumulate a CSRGraph one vertex / edge at a time.
+
+    Edges get streamed into flat (head, tail, weight) columns, and sorted
+    by head once, on build.
+    """
+
+    names: List[X]
+    ids: Dict[X, int]
+    heads: "array[int]"
+    tails: "array[int]"
+    weights: Optional["array[float]"]
+
+    def __init__(self, weighted: bool = False) -> None:
+        self.names, self.ids = [], {}
+        self.heads, self.tails = array("q"), array("q")
+        self.weights = array("d") if weighted else None
+
+    def add_vertex(self, name: X) -> int:
+        if (_id := self.ids.get(name)) is None:
+            _id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return _id
+
+    def add_edge(self, u: X, v: X, weight: float = 1.0) -> None:
+        self.heads.append(self.add_vertex(u))
+        self.tails.append(self.add_vertex(v))
+        if self.weights is not None:
+            self.weights.append(weight)
+
+    def build(self) -> CSRGraph[X]:
+        return CSRGraph.from_arrays(
+            self.names, self.ids, self.heads, self.tails, self.weights
+        )
@@ -1,16 +1,24 @@
 """Depth-first graph exploration primitive.
 
+On CSR graphs, SCCs come from a single iterative Tarjan pass, which also
+yields the topological order of the condensation (see `tarjan_sccs`).
+
 TODO: re-implement recursive version in terms of vertex color
-TODO: re-implement topological ordering and re-use it in SCC implementation
-TODO: tests
 """
+from array import array
 from collections import defaultdict, deque
+from dataclasses import dataclass
+from heapq import nlargest
+from itertools import accumulate
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable, Deque, Dict, List, Optional, cast
+from typing import Callable, Deque, Dict, List, Optional, Tuple, cast
 
 from devtools import debug
 
-from ._types import Color, Graph, X
+from ._types import Color, Graph, Traversal, X
+from .csr import CSRGraph
+from .loaders import load_edges
 
 
 def dfs(
@@ -18,32 +26,39 @@ def dfs(
     s_name: X,
     leader: Optional[X] = None,
     return_fin: bool = False,
-) -> List[X]:
+    state: Optional[Traversal[X]] = None,
+) -> Traversal[X]:
+    """Explore G from s, recording visits into state (or a fresh one).
+
+    With return_fin, vertices get appended to state.fin as they finish.
+    """
+    state = Traversal() if state is None else state
+    color = state.color
+
     q = deque([s_name])
-    fin: List[X] = list()
     while q:
-        v = g.vertices[q[-1]]
-        if v.seen:
+        v_name = q[-1]
+        if v_name in color:
             q.pop()
-            if v.color == Color.GRAY and return_fin:
-                fin.append(v.name)
-                v.color = Color.BLACK
+            if color[v_name] == Color.GRAY and return_fin:
+                state.fin.append(v_name)
+                color[v_name] = Color.BLACK
         else:
-            v.color = Color.GRAY
-            v.leader = leader
-            for w_name in g.edges[v.name]:
-                if not g.vertices[w_name].seen:
+            color[v_name] = Color.GRAY
+            state.leader[v_name] = leader
+            for w_name in g.edges[v_name]:
+                if w_name not in color:
                     q.append(w_name)
-    return fin
+    return state
 
 
 def topo_ord(g: Graph[X]) -> Deque[X]:
     """Return the node names of G in their topological ordering."""
-    q: Deque[X] = deque()
-    for v in g.vertices.values():
-        if not v.seen:
-            q.extend(dfs(g, v.name, return_fin=True))
-    return q
+    state: Traversal[X] = Traversal()
+    for v_name in g.vertices:
+        if not state.seen(v_name):
+            dfs(g, v_name, return_fin=True, state=state)
+    return deque(state.fin)
 
 
 def find_sccs(
@@ -51,30 +66,175 @@ def find_sccs(
 ) -> Dict[X, int]:
     _topo_ord = topo_ord(g_rev)
 
+    state: Traversal[X] = Traversal()
     while _topo_ord:
-        v = g.vertices[_topo_ord.pop()]
-        if not v.seen:
-            dfs(g, v.name, leader=v.name)
+        v_name = _topo_ord.pop()
+        if not state.seen(v_name):
+            dfs(g, v_name, leader=v_name, state=state)
 
     sccs: Dict[X, int] = defaultdict(int)
-    for v in g.vertices.values():
-        assert v.leader is not None
-        sccs[v.leader] += 1
+    for v_leader in state.leader.values():
+        assert v_leader is not None
+        sccs[v_leader] += 1
+
+    return _top_k(sccs, top_k)
+
+
+@dataclass(frozen=True)
+class SCCs:
+    """Strongly connected components of a CSR graph.
+
+    Component ids are dense and follow the topological order of the
+    condensation: edges between components only ever go from a lower id
+    to a higher one.
+    """
+
+    comp: "array[int]"  # dense vertex id -> component id
+    sizes: "array[int]"  # component id -> number of vertices
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def top_k(self, k: int) -> List[Tuple[int, int]]:
+        """Return (component id, size) of the k largest components."""
+        return nlargest(k, enumerate(self.sizes), key=itemgetter(1))
+
+
+def tarjan_sccs(g: CSRGraph) -> SCCs:
+    """Iterative Tarjan: one DFS over a single adjacency structure."""
+    tarjan = _Tarjan(g)
+    for s in range(len(g)):
+        if tarjan.index[s] < 0:
+            tarjan.dfs(s)
+
+    # Tarjan completes components sinks first => flip the ids around
+    comp, sizes = tarjan.comp, tarjan.sizes
+    last = len(sizes) - 1
+    for v in range(len(g)):
+        comp[v] = last - comp[v]
+    sizes.reverse()
+    return SCCs(comp=comp, sizes=sizes)
+
+
+class _Tarjan:
+    """State of `tarjan_sccs`, shared by the DFS from every root."""
+
+    def __init__(self, g: CSRGraph) -> None:
+        n, self.g = len(g), g
+        self.index = array("q", [-1]) * n
+        self.low = array("q", bytes(8 * n))
+        self.comp = array("q", [-1]) * n  # -1 for visited <=> on the stack
+        self.stack, self.sizes = array("q"), array("q")
+        self.counter = 0
+
+    def visit(self, v: int) -> None:
+        self.index[v] = self.low[v] = self.counter
+        self.counter += 1
+        self.stack.append(v)
+
+    def dfs(self, s: int) -> None:
+        offsets, targets = self.g.offsets, self.g.targets
+        index, low, comp = self.index, self.low, self.comp
+        self.visit(s)
+
+        # (vertex, position of its next edge to look at)
+        calls = [(s, offsets[s])]
+        while calls:
+            v, i = calls[-1]
+            end = offsets[v + 1]
+            while i < end:
+                w = targets[i]
+                i += 1
+                if index[w] < 0:
+                    break
+                if comp[w] < 0 and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                # all edges of v are done => return from v
+                calls.pop()
+                if low[v] == index[v]:
+                    self.pop_component(v)
+                if calls and low[v] < low[u := calls[-1][0]]:
+                    low[u] = low[v]
+                continue
+
+            # recurse into w
+            calls[-1] = v, i
+            self.visit(w)
+            calls.append((w, offsets[w]))
+
+    def pop_component(self, root: int) -> None:
+        """Pop everything down to the component root off the stack."""
+        size, comp_id = 0, len(self.sizes)
+        while True:
+            w = self.stack.pop()
+            self.comp[w] = comp_id
+            size += 1
+            if w == root:
+                break
+        self.sizes.append(size)
+
+
+def condensation(g: CSRGraph, sccs: SCCs) -> CSRGraph[int]:
+    """Return the DAG of components of G, without parallel edges."""
+    offsets, targets, comp = g.offsets, g.targets, sccs.comp
+
+    # bucket vertices by component (counting sort)
+    starts = array("q", accumulate(sccs.sizes, initial=0))
+    members = array("q", bytes(8 * len(g)))
+    for v in range(len(g)):
+        members[starts[comp[v]]] = v
+        starts[comp[v]] += 1
+
+    heads, tails = array("q"), array("q")
+    last_head = array("q", [-1]) * len(sccs)
+    for v in members:
+        c = comp[v]
+        for w in targets[offsets[v] : offsets[v + 1]]:
+            if c not in (c_w := comp[w], last_head[c_w]):
+                last_head[c_w] = c
+                heads.append(c)
+                tails.append(c_w)
+
+    names = list(range(len(sccs)))
+    return CSRGraph.from_arrays(
+        names, dict(zip(names, names)), heads, tails, None
+    )
+
+
+def topo_ord_csr(g: CSRGraph) -> "array[int]":
+    """Return the dense vertex ids of a DAG in topological order.
+
+    For graphs with cycles, vertices come out grouped by component, in the
+    topological order of the condensation.
+    """
+    comp = tarjan_sccs(g).comp
+    return array("q", sorted(range(len(g)), key=comp.__getitem__))
+
+
+def find_sccs_csr(g: CSRGraph[X], top_k: Optional[int] = None) -> Dict[X, int]:
+    """Same as `find_sccs`, through Tarjan on a single CSR graph.
+
+    Components are named after their lowest dense vertex id.
+    """
+    sccs = tarjan_sccs(g)
+    leaders = array("q", [-1]) * len(sccs)
+    for v in range(len(g) - 1, -1, -1):
+        leaders[sccs.comp[v]] = v
+
+    _sizes = enumerate(sccs.sizes) if top_k is None else sccs.top_k(top_k)
+    return {g.names[leaders[c]]: size for c, size in _sizes}
+
 
+def _top_k(sccs: Dict[X, int], top_k: Optional[int]) -> Dict[X, int]:
     if top_k is None:
         return sccs
     _key = cast(Callable, sccs.get)  # stfu mypy
-    return {_: sccs[_] for _ in sorted(sccs, key=_key)[:top_k]}
+    return {_: sccs[_] for _ in nlargest(top_k, sccs, key=_key)}
 
 
 if __name__ == "__main__":
-    rows = [
-        _.split()
-        for _ in (Path(__file__).parent / "../../data/scc_small.txt")
-        .read_text()
-        .splitlines()
-        if _
-    ]
-    edges = [(int(row[0]), int(row[1])) for row in rows]
-    _g, _g_rev = Graph[int].from_edges(edges)
-    debug(find_sccs(_g_rev, _g))
+    _g = load_edges(
+        Path(__file__).parent / "../../data/scc_small.txt", cache=True
+    )
+    debug(find_sccs_csr(_g, top_k=5))
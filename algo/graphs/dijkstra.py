@@ -5,11 +5,34 @@ therefore running in O(MN) time.
 
 Using a heap with clever invariants we can achieve a blazing O(M log N)
 running time.
+
+`dijsktra_heap` takes the heap engine as an argument, so the array-backed
+`algo.heap.dary.DaryHeap` can be swapped in for large graphs.
+
+For point-to-point queries `dijsktra_lazy` only ever pushes discovered
+vertices onto a plain `heapq`, skips stale entries when they surface, and
+stops as soon as all targets are settled. Given a heuristic it becomes A*,
+see also `algo.graphs.point_to_point`.
 """
 import math
-from typing import Dict, NamedTuple, Tuple
+from array import array
+from heapq import heappop, heappush
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from algo.heap import Heap
+from algo.heap.dary import DaryHeap
+
+from .csr import CSRGraph
 
 VName = int
 
@@ -28,6 +51,19 @@ class Vertex(NamedTuple):
 Graph = Dict[VName, list[Edge]]
 ShortestDists = Dict[VName, float]
 ShortestPaths = Dict[VName, list[VName]]
+Predecessors = Dict[VName, Optional[VName]]
+Heuristic = Callable[[VName], float]
+
+
+def reverse_graph(g: Graph) -> Graph:
+    """Return G with every edge flipped, e.g. for backward searches."""
+    g_rev: Graph = {v: [] for v in g}
+    for edges in g.values():
+        for edge in edges:
+            g_rev.setdefault(edge.tail, []).append(
+                Edge(edge.tail, edge.head, edge.dist)
+            )
+    return g_rev
 
 
 def dijsktra_naive(g: Graph, s: VName) -> Tuple[ShortestDists, ShortestPaths]:
@@ -49,13 +85,17 @@ def dijsktra_naive(g: Graph, s: VName) -> Tuple[ShortestDists, ShortestPaths]:
     return a, b
 
 
-def dijsktra_heap(g: Graph, s: VName) -> ShortestDists:
+def dijsktra_heap(
+    g: Graph,
+    s: VName,
+    heap_cls: Type[Union[Heap, DaryHeap]] = Heap,
+) -> ShortestDists:
     explored, a = {s}, {s: 0.0}
 
     s_distances = {_.tail: _.dist for _ in g[s]}
     vertices = set(g.keys()) - explored
 
-    _heap = Heap[Vertex].from_iterable(
+    _heap = heap_cls.from_iterable(
         (Vertex(_, s_distances.get(_, math.inf)) for _ in vertices)
     )
 
@@ -66,10 +106,87 @@ def dijsktra_heap(g: Graph, s: VName) -> ShortestDists:
 
         for edge in g[w.name]:
             if edge.tail not in explored:
-                old_v = _heap.delete(edge.tail)
-                new_v = Vertex(
-                    edge.tail,
-                    key=min(old_v.key, a[edge.head] + edge.dist),
-                )
-                _heap.insert(new_v)
+                _heap.decrease_key(Vertex(edge.tail, w.key + edge.dist))
     return a
+
+
+def dijsktra_lazy(
+    g: Graph,
+    s: VName,
+    targets: Optional[Iterable[VName]] = None,
+    heuristic: Optional[Heuristic] = None,
+) -> Tuple[ShortestDists, Predecessors]:
+    """Return distances and predecessors of the vertices settled from s.
+
+    If targets are given, the search stops once all of them are settled,
+    otherwise it settles everything reachable from s.
+
+    A heuristic turns this into A*: vertices get popped by distance plus
+    estimated distance left. It must be consistent (never overestimate an
+    edge: h(u) <= dist(u, v) + h(v)), or settled distances may be off.
+    """
+    pending = None if targets is None else set(targets)
+    a: ShortestDists = {}
+    preds: Predecessors = {}
+
+    tentative: ShortestDists = {s: 0.0}
+    parent: Predecessors = {s: None}
+    q: List[Tuple[float, VName]] = [(0.0, s)]
+
+    while q:
+        _, v = heappop(q)
+        if v in a:
+            # stale entry, v got settled through a shorter path
+            continue
+        a[v], preds[v] = (dist := tentative[v]), parent[v]
+
+        if pending is not None:
+            pending.discard(v)
+            if not pending:
+                break
+
+        for edge in g.get(v, ()):
+            if edge.tail in a:
+                continue
+            new_dist = dist + edge.dist
+            if new_dist < tentative.get(edge.tail, math.inf):
+                tentative[edge.tail], parent[edge.tail] = new_dist, v
+                if heuristic is not None:
+                    new_dist += heuristic(edge.tail)
+                heappush(q, (new_dist, edge.tail))
+    return a, preds
+
+
+def dijsktra_csr(g: CSRGraph[VName], s: VName) -> "array[float]":
+    """Return shortest distances from s by dense vertex id, inf if unreachable.
+
+    Same lazy-deletion scheme as `dijsktra_lazy`, with all state in arrays.
+    """
+    assert g.weights is not None, "dijkstra needs a weighted graph"
+    offsets, targets, weights = g.offsets, g.targets, g.weights
+    a = array("d", [math.inf]) * len(g)
+    explored = bytearray(len(g))
+
+    a[s_id := g.ids[s]] = 0.0
+    q: List[Tuple[float, int]] = [(0.0, s_id)]
+    while q:
+        dist, v = heappop(q)
+        if explored[v]:
+            continue
+        explored[v] = 1
+
+        for i in range(offsets[v], offsets[v + 1]):
+            if (new_dist := dist + weights[i]) < a[w := targets[i]]:
+                a[w] = new_dist
+                heappush(q, (new_dist, w))
+    return a
+
+
+def path_to(preds: Predecessors, t: VName) -> list[VName]:
+    """Unwind predecessor pointers into a `dijsktra_naive`-style path."""
+    path: list[VName] = []
+    v: Optional[VName] = t
+    while v is not None and (p := preds[v]) is not None:
+        path.append(v)
+        v = p
+    return path[::-1]
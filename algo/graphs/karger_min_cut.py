@@ -2,31 +2,94 @@
 """
 Probably extremely suboptimal implementation of
 Karger's minimum cut algorithm for undirected graphs.
+
+`EdgeGraph` is the less suboptimal one: contracting edges in a uniformly
+random order until two supernodes are left is Kruskal's algorithm with
+random weights, so a union-find over a flat edge list does the job, and
+the cut gets counted in a single pass over the same list.
 """
 import math
 import random
+import sys
+from array import array
 from copy import deepcopy
 from functools import partial
 from multiprocessing import Pool
 from pathlib import Path
-from typing import Dict, Generator, List, Set, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from more_itertools import grouper
+from algo.graphs.loaders import iter_adj_l
+from algo.graphs.union_find import UnionFind
 
 Vertex = int
+KS_BRUTE_FORCE = 6
 Adjacency = Set[Vertex]
 AdjacencyRow = List[Vertex]
 Edge = Tuple[Vertex, Vertex]
 
 
+class EdgeSampler:
+    """Uniform O(1) picks among the edges still crossing supernodes.
+
+    The original edges sit in a flat list and never get relabeled; a pick
+    maps the drawn edge onto its current supernodes, and swap-removes it
+    for good if it turned into a self-loop. Every edge gets discarded at
+    most once, and parallel edges between supernodes keep their weight.
+    """
+
+    edges: List[Edge]
+    rng: random.Random
+
+    def __init__(self, edges: Iterable[Edge], rng: random.Random) -> None:
+        self.edges = list(edges)
+        self.rng = rng
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def pick(self, owner: Callable[[Vertex], Vertex]) -> Optional[Edge]:
+        """Return a random crossing edge, or None once they're all gone."""
+        edges = self.edges
+        while edges:
+            i = self.rng.randrange(len(edges))
+            u, v = owner(edges[i][0]), owner(edges[i][1])
+            if u != v:
+                return u, v
+            edges[i] = edges[-1]
+            edges.pop()
+        return None
+
+
 class Graph:
     graph: Dict[Vertex, Adjacency]
     _orig: Dict[Vertex, Adjacency]
+    _owner: Dict[Vertex, Vertex]  # original vertex -> current supernode
+    _members: Dict[Vertex, List[Vertex]]  # supernode -> original vertices
+    _sampler: EdgeSampler
     max_node: int
 
-    def __init__(self, graph: Dict[Vertex, Adjacency]) -> None:
+    def __init__(
+        self,
+        graph: Dict[Vertex, Adjacency],
+        rng: Optional[random.Random] = None,
+    ) -> None:
         self.graph = graph
         self._orig = deepcopy(graph)
+        self._owner = {v: v for v in graph}
+        self._members = {v: [v] for v in graph}
+        self._sampler = EdgeSampler(
+            {_make_edge(u, v) for u, adj in graph.items() for v in adj},
+            rng=rng or random.Random(),
+        )
         self.max_node = max(graph.keys())
 
     def _supernode(self) -> Generator[int, None, None]:
@@ -36,19 +99,24 @@ class Graph:
             a = a + 1
 
     @classmethod
-    def from_adjacency_list(cls, adj_l: List[AdjacencyRow]) -> "Graph":
+    def from_adjacency_list(
+        cls, adj_l: List[AdjacencyRow], rng: Optional[random.Random] = None
+    ) -> "Graph":
         _graph = {}
         for row in adj_l:
             vertex, *edges = row
             _graph[vertex] = set(edges)
-        return cls(_graph)
+        return cls(_graph, rng=rng)
 
     def search_min_cut(self) -> int:
         super_gen = self._supernode()
         contractions = {}
 
         while len(self.graph) > 2:
-            u, v = self.select_random_edge()
+            if (edge := self.select_random_edge()) is None:
+                # more than two supernodes and no edge across => disconnected
+                return 0
+            u, v = edge
             super_v = next(super_gen)
             contractions[super_v] = (u, v)
 
@@ -68,6 +136,13 @@ class Graph:
             self.graph.pop(u)
             self.graph.pop(v)
 
+            # keep the edge sampler's view of the supernodes current
+            self._members[super_v] = [
+                *self._members.pop(u),
+                *self._members.pop(v),
+            ]
+            self._owner.update(dict.fromkeys(self._members[super_v], super_v))
+
         x, y = list(self.graph.keys())[:2]
         _expander = partial(
             _expand_node, contractions, set(contractions.keys())
@@ -84,9 +159,121 @@ class Graph:
         }
         return len(cut_edges)
 
-    def select_random_edge(self) -> Edge:
-        u, v = random.sample(self.graph.keys(), k=2)
-        return u, v
+    def select_random_edge(self) -> Optional[Edge]:
+        return self._sampler.pick(self._owner.__getitem__)
+
+
+class EdgeGraph:
+    ids: Dict[Vertex, int]
+    heads: "array[int]"
+    tails: "array[int]"
+
+    def __init__(
+        self, edges: Iterable[Edge], vertices: Iterable[Vertex] = ()
+    ) -> None:
+        self.ids, self.heads, self.tails = {}, array("q"), array("q")
+        for v in vertices:
+            self.ids.setdefault(v, len(self.ids))
+        for u, v in edges:
+            self.heads.append(self.ids.setdefault(u, len(self.ids)))
+            self.tails.append(self.ids.setdefault(v, len(self.ids)))
+
+    @classmethod
+    def from_adjacency_list(cls, adj_l: List[AdjacencyRow]) -> "EdgeGraph":
+        # every undirected edge shows up in the rows of both endpoints
+        return cls(
+            {_make_edge(u, v) for u, *adj in adj_l for v in adj if u != v},
+            vertices=(row[0] for row in adj_l),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def contract(self, rng: random.Random, down_to: int = 2) -> UnionFind:
+        """Contract uniformly random edges until down_to supernodes remain.
+
+        Edges get drawn through a lazy Fisher-Yates shuffle, so a trial
+        only pays for the edges it actually looks at.
+        """
+        uf, heads, tails = UnionFind(len(self)), self.heads, self.tails
+        order = array("q", range(len(heads)))
+
+        for k in range(len(heads)):
+            if uf.num_sets <= down_to:
+                break
+            j = rng.randrange(k, len(order))
+            order[k], order[j] = order[j], order[k]
+            uf.union(heads[order[k]], tails[order[k]])
+        return uf
+
+    def cut_size(self, uf: UnionFind) -> int:
+        labels = uf.labels()
+        return sum(
+            labels[u] != labels[v] for u, v in zip(self.heads, self.tails)
+        )
+
+    def search_min_cut(self, rng: Optional[random.Random] = None) -> int:
+        return self.cut_size(self.contract(rng or random.Random()))
+
+    def contracted(self, uf: UnionFind) -> "EdgeGraph":
+        """Return the multigraph of supernodes, minus the self-loops."""
+        labels = uf.labels()
+        return EdgeGraph(
+            (
+                (labels[u], labels[v])
+                for u, v in zip(self.heads, self.tails)
+                if labels[u] != labels[v]
+            ),
+            vertices=sorted(set(labels)),
+        )
+
+    def brute_min_cut(self) -> int:
+        """Try all 2^(n-1) - 1 bipartitions, for tiny graphs."""
+        _edges = list(zip(self.heads, self.tails))
+        return min(
+            (
+                sum((mask >> u & 1) != (mask >> v & 1) for u, v in _edges)
+                for mask in range(1, 1 << (len(self) - 1))
+            ),
+            default=0,
+        )
+
+    def search_min_cut_ks(self, rng: Optional[random.Random] = None) -> int:
+        """One Karger-Stein run: contract to n / sqrt(2), recurse twice.
+
+        Succeeds with probability Omega(1 / log n), versus Omega(1 / n^2)
+        for a plain contraction, at O(n^2 log n) cost per run.
+        """
+        rng = rng or random.Random()
+        if not self.heads:
+            return 0
+        if len(self) <= KS_BRUTE_FORCE:
+            return self.brute_min_cut()
+
+        down_to = math.ceil(1 + len(self) / math.sqrt(2))
+        return min(
+            self.contracted(self.contract(rng, down_to)).search_min_cut_ks(rng)
+            for _ in range(2)
+        )
+
+
+def karger_trials(n: int, success: float = 0.99) -> int:
+    """Plain contraction runs needed to find a min cut with this odds."""
+    return _repetitions(2 / (n * (n - 1)), success)
+
+
+def karger_stein_trials(n: int, success: float = 0.99) -> int:
+    """Karger-Stein runs needed to find a min cut with this odds.
+
+    A run recurses through ~2 log2(n) levels and succeeds with probability
+    at least 1 / (levels + 1).
+    """
+    return _repetitions(1 / (2 * math.log2(max(n, 2)) + 1), success)
+
+
+def _repetitions(p_run: float, success: float) -> int:
+    # all runs fail with probability (1 - p)^k <= exp(-p * k)
+    return math.ceil(math.log(1 / (1 - success)) / min(p_run, 1.0))
 
 
 def _make_edge(x: Vertex, y: Vertex) -> Edge:
@@ -111,27 +298,55 @@ def _expand_node(
     return expanded | primal
 
 
-def _compute(adj_l: List[AdjacencyRow], _: int) -> int:
-    return Graph.from_adjacency_list(adj_l).search_min_cut()
+def _compute(adj_l: List[AdjacencyRow], seed: int) -> int:
+    _rng = random.Random(seed)
+    return Graph.from_adjacency_list(adj_l, rng=_rng).search_min_cut()
+
+
+# every pool worker builds the graph once, in its initializer
+_WORKER_GRAPH: Optional[EdgeGraph] = None
+
+
+def _init_worker(adj_l: List[AdjacencyRow]) -> None:
+    global _WORKER_GRAPH  # pylint:disable=global-statement
+    _WORKER_GRAPH = EdgeGraph.from_adjacency_list(adj_l)
+
+
+def _run_trials(
+    batch: Tuple[int, int], karger_stein: bool = False
+) -> Tuple[int, int]:
+    """Run a (seed, number of trials) batch; return (trials, min cut)."""
+    seed, num_trials = batch
+    assert _WORKER_GRAPH is not None
+    rng = random.Random(seed)
+    _search = (
+        _WORKER_GRAPH.search_min_cut_ks
+        if karger_stein
+        else _WORKER_GRAPH.search_min_cut
+    )
+    return num_trials, min(_search(rng) for _ in range(num_trials))
 
 
 if __name__ == "__main__":
-    lines = [
-        _
-        for _ in (Path(__file__).parent / "../../data/min_cut.txt")
-        .read_text()
-        .splitlines()
-        if _
+    # usage: karger_min_cut.py [karger|karger-stein] [success probability]
+    _mode = sys.argv[1] if len(sys.argv) >= 2 else "karger"
+    _success = float(sys.argv[2]) if len(sys.argv) >= 3 else 0.99
+    _adj_l = list(iter_adj_l(Path(__file__).parent / "../../data/min_cut.txt"))
+
+    _n, _done, _min = len(_adj_l), 0, math.inf
+    _ks = _mode == "karger-stein"
+    _num_tries = (karger_stein_trials if _ks else karger_trials)(_n, _success)
+    _batch_size = 10 if _ks else 1000
+    _batches = [
+        (_seed, min(_batch_size, _num_tries - _start))
+        for _seed, _start in enumerate(range(0, _num_tries, _batch_size))
     ]
-    _adj_l = [[int(_) for _ in line.split()] for line in lines]
-
-    _n = len(_adj_l)
-    _num_tries, _done, _min = math.ceil(_n * _n * math.log(_n)), 0, math.inf
-    _computer = partial(_compute, _adj_l)
-
-    for _chunk in grouper(range(0, _num_tries), 1000):
-        with Pool() as pool:
-            _cuts = pool.map(_computer, _chunk)
-            _min = min(min(_cuts), _min)
-            _done += len(_chunk)
-            print(f"after {_done} iterations, min cut is {_min}")
+
+    with Pool(initializer=_init_worker, initargs=(_adj_l,)) as pool:
+        _runner = partial(_run_trials, karger_stein=_ks)
+        for _trials, _cut in pool.imap_unordered(_runner, _batches):
+            _min = min(_cut, _min)
+            _done += _trials
+            print(
+                f"after {_done}/{_num_tries} {_mode} runs, min cut is {_min}"
+            )
@@ -0,0 +1,168 @@
+"""Streaming loaders for the graph text formats used around here.
+
+- edge lists: one `u v` pair per line (SCC inputs);
+- adjacency lists: `v w1 w2 ...` per line (min cut, BFS inputs);
+- weighted adjacency lists: `v w1,d1 w2,d2 ...` per line (Dijkstra inputs).
+
+Files get read line by line through a large buffer, straight into the
+graph being built, so neither the file contents nor the split lines are
+ever held in memory at once.
+
+Parsed graphs can be cached next to the input in a binary CSR format
+(a small header followed by the raw arrays), which reloads at disk speed.
+The cache is refreshed whenever the input is newer or it doesn't match
+its header (e.g. a write got interrupted), and uses the native byte order,
+so it isn't meant to be shared across machines.
+"""
+import os
+import struct
+import tempfile
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, List, Tuple
+
+from .csr import CSRBuilder, CSRGraph
+from .dijkstra import Edge
+from .dijkstra import Graph as DGraph
+
+BUFFER_SIZE = 1 << 20
+CACHE_SUFFIX = ".csr"
+_MAGIC = b"CSR\x01"
+_HEADER = struct.Struct("<4sqq?")  # magic, #vertices, #edges, weighted?
+
+WeightedRow = Tuple[int, List[Tuple[int, float]]]
+
+
+def _rows(path: Path) -> Iterator[List[bytes]]:
+    with open(path, "rb", buffering=BUFFER_SIZE) as f:
+        for line in f:
+            if row := line.split():
+                yield row
+
+
+def iter_edges(path: Path) -> Iterator[Tuple[int, int]]:
+    for row in _rows(path):
+        yield int(row[0]), int(row[1])
+
+
+def iter_adj_l(path: Path) -> Iterator[List[int]]:
+    for row in _rows(path):
+        yield list(map(int, row))
+
+
+def iter_weighted(path: Path) -> Iterator[WeightedRow]:
+    for head, *edges in _rows(path):
+        yield int(head), [
+            (int(tail), float(dist))
+            for tail, dist in (_.split(b",") for _ in edges)
+        ]
+
+
+def load_edges(path: Path, cache: bool = False) -> CSRGraph[int]:
+    return _cached(
+        path, cache, lambda: CSRGraph[int].from_edges(iter_edges(path))
+    )
+
+
+def load_adj_l(path: Path, cache: bool = False) -> CSRGraph[int]:
+    return _cached(
+        path, cache, lambda: CSRGraph[int].from_adj_l(iter_adj_l(path))
+    )
+
+
+def load_weighted(path: Path, cache: bool = False) -> CSRGraph[int]:
+    def _load() -> CSRGraph[int]:
+        builder: CSRBuilder[int] = CSRBuilder(weighted=True)
+        for head, edges in iter_weighted(path):
+            builder.add_vertex(head)
+            for tail, dist in edges:
+                builder.add_edge(head, tail, dist)
+        return builder.build()
+
+    return _cached(path, cache, _load)
+
+
+def load_dijkstra(path: Path) -> DGraph:
+    """Load a weighted adjacency list as `algo.graphs.dijkstra.Graph`."""
+    g: DGraph = defaultdict(list)
+    for head, edges in iter_weighted(path):
+        g[head] = [Edge(head, tail, dist) for tail, dist in edges]
+    return g
+
+
+def write_csr(g: CSRGraph[int], path: Path) -> None:
+    """Write to a temp file next to path, then move it over atomically."""
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=path.parent, prefix=path.name, delete=False
+    ) as f:
+        try:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC, len(g), g.num_edges, g.weights is not None
+                )
+            )
+            array("q", g.names).tofile(f)
+            g.offsets.tofile(f)
+            g.targets.tofile(f)
+            if g.weights is not None:
+                g.weights.tofile(f)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, path)
+
+
+def read_csr(path: Path) -> CSRGraph[int]:
+    """Raise ValueError if path isn't a CSR cache, or is truncated."""
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        if size < _HEADER.size:
+            raise ValueError(f"{path} is not a CSR cache")
+        magic, n, m, weighted = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a CSR cache")
+        if size != _HEADER.size + 8 * (2 * n + 1 + m * (1 + weighted)):
+            raise ValueError(f"{path} doesn't match its header")
+
+        names = _read_array(f, "q", n)
+        offsets = _read_array(f, "q", n + 1)
+        targets = _read_array(f, "q", m)
+        weights = _read_array(f, "d", m) if weighted else None
+
+    _names = names.tolist()
+    return CSRGraph(
+        names=_names,
+        ids=dict(zip(_names, range(n))),
+        offsets=offsets,
+        targets=targets,
+        weights=weights,
+    )
+
+
+def _read_array(f: BinaryIO, typecode: str, n: int) -> array:
+    _arr = array(typecode)
+    _arr.fromfile(f, n)
+    return _arr
+
+
+def _cached(
+    path: Path, cache: bool, load: Callable[[], CSRGraph[int]]
+) -> CSRGraph[int]:
+    if not cache:
+        return load()
+
+    cache_path = path.with_name(path.name + CACHE_SUFFIX)
+    if (
+        cache_path.exists()
+        and cache_path.stat().st_mtime >= path.stat().st_mtime
+    ):
+        try:
+            return read_csr(cache_path)
+        except ValueError:
+            pass  # stale or broken => rebuilt below
+
+    g = load()
+    write_csr(g, cache_path)
+    return g
@@ -0,0 +1,122 @@
+"""Point-to-point shortest paths on the `algo.graphs.dijkstra` Graph type.
+
+A single s -> t query doesn't need the whole shortest path tree:
+
+- bidirectional Dijkstra grows a ball from s on G and one from t on the
+  reversed G, and stops soon after they touch;
+- A* pulls the search towards t using a consistent distance estimate.
+
+Both settle a fraction of the vertices a plain Dijkstra sweep does.
+"""
+import math
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from .dijkstra import (
+    Graph,
+    Heuristic,
+    Predecessors,
+    ShortestDists,
+    VName,
+    dijsktra_lazy,
+    path_to,
+)
+
+Coords = Mapping[VName, Tuple[float, float]]
+
+
+class Query(NamedTuple):
+    dist: float
+    path: list[VName]
+    settled: int
+
+
+def dijsktra_p2p(g: Graph, s: VName, t: VName) -> Query:
+    """Plain Dijkstra with early exit, as a baseline."""
+    return a_star(g, s, t, heuristic=None)
+
+
+def a_star(
+    g: Graph, s: VName, t: VName, heuristic: Optional[Heuristic]
+) -> Query:
+    dists, preds = dijsktra_lazy(g, s, targets=[t], heuristic=heuristic)
+    if t not in dists:
+        return Query(math.inf, [], len(dists))
+    return Query(dists[t], path_to(preds, t), len(dists))
+
+
+def euclidean(coords: Coords, t: VName, scale: float = 1.0) -> Heuristic:
+    """Straight-line distance to t.
+
+    Consistent as long as no edge is shorter than `scale` times the
+    distance between its endpoints.
+    """
+    t_xy = coords[t]
+    return lambda v: scale * math.dist(coords[v], t_xy)
+
+
+def dijsktra_bidi(g: Graph, g_rev: Graph, s: VName, t: VName) -> Query:
+    """Alternate between a forward search on G and a backward one on g_rev.
+
+    Every edge relaxed into a vertex already reached from the other side
+    closes an s -> t path. Once the two frontiers' smallest keys add up to
+    at least the best such path, nothing shorter can turn up.
+    """
+    balls = (_Ball.around(g, s), _Ball.around(g_rev, t))
+    best, meet = (0.0, s) if s == t else (math.inf, None)
+    while balls[0].radius() + balls[1].radius() < best:
+        # expand the side with the closer frontier
+        ball, other = (
+            balls if balls[0].radius() <= balls[1].radius() else balls[::-1]
+        )
+        dist, v = heappop(ball.q)
+        if v in ball.settled:
+            # stale entry, v got settled through a shorter path
+            continue
+        ball.settled[v] = dist
+
+        for w in ball.relax(v, dist):
+            if w in other.tentative:
+                _through = ball.tentative[w] + other.tentative[w]
+                if _through < best:
+                    best, meet = _through, w
+
+    _settled = len(balls[0].settled) + len(balls[1].settled)
+    if meet is None:
+        return Query(math.inf, [], _settled)
+    return Query(best, _stitch(balls, meet, t), _settled)
+
+
+@dataclass
+class _Ball:
+    """What one side of `dijsktra_bidi` has reached so far."""
+
+    g: Graph
+    tentative: ShortestDists
+    parents: Predecessors
+    settled: Dict[VName, float]
+    q: List[Tuple[float, VName]]
+
+    @classmethod
+    def around(cls, g: Graph, v: VName) -> "_Ball":
+        return cls(g, {v: 0.0}, {v: None}, {}, [(0.0, v)])
+
+    def radius(self) -> float:
+        """Smallest key of the frontier, inf once it's empty."""
+        return self.q[0][0] if self.q else math.inf
+
+    def relax(self, v: VName, dist: float) -> Iterator[VName]:
+        """Relax the edges out of v, settled at dist; yield their tails."""
+        for edge in self.g.get(v, ()):
+            w, new_dist = edge.tail, dist + edge.dist
+            if new_dist < self.tentative.get(w, math.inf):
+                self.tentative[w], self.parents[w] = new_dist, v
+                heappush(self.q, (new_dist, w))
+            yield w
+
+
+def _stitch(balls: Tuple[_Ball, _Ball], meet: VName, t: VName) -> List[VName]:
+    """s ~> meet from the forward tree, then meet ~> t from the backward one."""
+    backward = [*reversed(path_to(balls[1].parents, meet)), t][1:]
+    return [*path_to(balls[0].parents, meet), *backward]
@@ -0,0 +1,91 @@
+"""Tests for the CSR graph representation."""
+import random
+import tracemalloc
+from time import time
+from typing import Any, Callable, List, Tuple
+
+import pytest
+
+from ._types import Graph
+from .bfs import bfs, bfs_csr
+from .csr import CSRGraph
+from .dfs import find_sccs, find_sccs_csr
+from .dijkstra import dijsktra_csr, dijsktra_lazy
+from .test_dijsktra import _random_graph
+
+
+def _random_edges(n: int, m: int, seed: int = 42) -> List[Tuple[int, int]]:
+    rng = random.Random(seed)
+    return [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+
+
+def test_from_adj_l() -> None:
+    _adj_l = [["s", "a", "b"], ["a", "c"], ["b", "c", "d"], ["c"], ["d"]]
+    g = CSRGraph[str].from_adj_l(_adj_l)
+
+    assert len(g) == 5 and g.num_edges == 5
+    assert {
+        g.names[v]: sorted(g.names[_] for _ in g.neighbours(v))
+        for v in range(len(g))
+    } == {"s": ["a", "b"], "a": ["c"], "b": ["c", "d"], "c": [], "d": []}
+    g_rev = g.reverse()
+    assert {g_rev.names[_] for _ in g_rev.neighbours(g.ids["c"])} == {"a", "b"}
+
+
+def test_bfs_csr() -> None:
+    _g, _ = Graph[int].from_edges(_random_edges(200, 600))
+    g = CSRGraph[int].from_graph(_g)
+
+    dist = bfs_csr(g, 0)
+    state = bfs(_g, 0)
+    for v_name in _g.vertices:
+        assert dist[g.ids[v_name]] == state.dist.get(v_name, -1)
+
+
+def test_find_sccs_csr() -> None:
+    edges = _random_edges(300, 400)
+    _g, _g_rev = Graph[int].from_edges(edges)
+    expected = find_sccs(_g, _g_rev)
+
+    sccs = find_sccs_csr(CSRGraph[int].from_edges(edges))
+    assert sorted(sccs.values()) == sorted(expected.values())
+    assert sum(sccs.values()) == len(_g.vertices)
+
+
+def test_dijsktra_csr() -> None:
+    _graph = _random_graph()
+    g = CSRGraph[int].from_dijkstra(_graph)
+
+    dists = dijsktra_csr(g, 0)
+    assert {g.names[v]: d for v, d in enumerate(dists)} == dijsktra_lazy(
+        _graph, 0
+    )[0]
+
+
+def _measure(build: Callable[[], Any]) -> Tuple[Any, float, int]:
+    tracemalloc.start()
+    start_time = time()
+    built = build()
+    _elapsed = time() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, _elapsed, peak
+
+
+@pytest.mark.bench
+def test_speedup() -> None:
+    n, m = 50_000, 500_000
+    edges = _random_edges(n, m)
+
+    (_g, _), t_dict, mem_dict = _measure(lambda: Graph.from_edges(edges))
+    g, t_csr, mem_csr = _measure(lambda: CSRGraph.from_edges(edges))
+    print(f"dict graphs: built in {t_dict:.2f}s, peak {mem_dict >> 20}MiB")
+    print(f"CSR graph: built in {t_csr:.2f}s, peak {mem_csr >> 20}MiB")
+
+    start_time = time()
+    bfs(_g, 0)
+    print(f"dict bfs: {m / (time() - start_time):.0f} edges/s")
+
+    start_time = time()
+    bfs_csr(g, 0)
+    print(f"CSR bfs: {m / (time() - start_time):.0f} edges/s")
@@ -1,7 +1,20 @@
 """Tests for DFS."""
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, tuples
 
 from ._types import Graph
+from .csr import CSRGraph
+from .dfs import (
+    condensation,
+    find_sccs,
+    find_sccs_csr,
+    tarjan_sccs,
+    topo_ord,
+    topo_ord_csr,
+)
 
 EXPECTED_SCCS = [434821, 968, 459, 313, 211]
 
@@ -23,3 +36,54 @@ def simple_digraph() -> Graph[str]:
         ["e"],
     ]
     return Graph.from_adj_l(_adj_l)
+
+
+def test_topo_ord(simple_digraph: Graph[str]) -> None:
+    # finishing order => every edge points towards the front
+    _ord = list(topo_ord(simple_digraph))
+    for u, adj in simple_digraph.edges.items():
+        assert all(_ord.index(v) < _ord.index(u) for v in adj)
+
+
+def test_graph_reuse() -> None:
+    g, g_rev = Graph[int].from_edges(
+        [(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 4), (6, 6)]
+    )
+    with ThreadPoolExecutor(4) as pool:
+        runs = list(pool.map(lambda _: find_sccs(g, g_rev), range(16)))
+    assert all(sorted(_.values()) == [1, 2, 3] for _ in runs)
+
+
+@given(lists(tuples(integers(0, 40), integers(0, 40)), min_size=1))
+def test_tarjan_sccs(edges: list[tuple[int, int]]) -> None:
+    g = CSRGraph[int].from_edges(edges)
+    sccs = tarjan_sccs(g)
+
+    # same partition as Kosaraju on the dict graphs
+    _g, _g_rev = Graph[int].from_edges(edges)
+    assert sorted(sccs.sizes) == sorted(find_sccs(_g, _g_rev).values())
+    assert sum(sccs.sizes) == len(g)
+
+    # ids follow the topological order of the condensation
+    dag = condensation(g, sccs)
+    for c in range(len(dag)):
+        assert all(c < _ for _ in dag.neighbours(c))
+        assert len(set(dag.neighbours(c))) == len(dag.neighbours(c))
+    for u, v in edges:
+        assert sccs.comp[g.ids[u]] <= sccs.comp[g.ids[v]]
+
+
+def test_topo_ord_csr(simple_digraph: Graph[str]) -> None:
+    g = CSRGraph[str].from_graph(simple_digraph)
+    _ord = [g.names[_] for _ in topo_ord_csr(g)]
+    for u, adj in simple_digraph.edges.items():
+        assert all(_ord.index(u) < _ord.index(v) for v in adj)
+
+
+def test_deep_sccs() -> None:
+    # way past the recursion limit: a long path closed into a cycle + a tail
+    n = 200_000
+    g = CSRGraph[int].from_edges(
+        [*((_, _ + 1) for _ in range(n - 1)), (n // 2, 0)]
+    )
+    assert find_sccs_csr(g, top_k=2) == {0: n // 2 + 1, n // 2 + 1: 1}
@@ -1,23 +1,38 @@
 """Tests for dijkstra."""
-from collections import defaultdict
+import random
 from pathlib import Path
+from typing import Type
 
-from .dijkstra import Edge, Graph, dijsktra_heap, dijsktra_naive
+import pytest
+
+from algo.heap import Heap
+from algo.heap.dary import DaryHeap
+
+from .dijkstra import (
+    Edge,
+    Graph,
+    dijsktra_heap,
+    dijsktra_lazy,
+    dijsktra_naive,
+    path_to,
+)
+from .loaders import load_dijkstra
+
+
+def _random_graph(n: int = 60, m: int = 400, seed: int = 42) -> Graph:
+    rng = random.Random(seed)
+    _graph: Graph = {v: [] for v in range(n)}
+    # a ring keeps every vertex reachable from every other one
+    for v in range(n):
+        _graph[v].append(Edge(v, (v + 1) % n, rng.randint(50, 100)))
+    for _ in range(m):
+        head, tail = rng.sample(range(n), k=2)
+        _graph[head].append(Edge(head, tail, rng.randint(1, 100)))
+    return _graph
 
 
 def test_dijsktra() -> None:
-    rows = [
-        _.split()
-        for _ in (Path(__file__).parent / "../../data/dijsktra.txt")
-        .read_text()
-        .splitlines()
-        if _
-    ]
-
-    _graph: Graph = defaultdict(list)
-    for head, *edges in rows:
-        _head = int(head)
-        _graph[_head] = [Edge(_head, *map(int, _.split(","))) for _ in edges]
+    _graph = load_dijkstra(Path(__file__).parent / "../../data/dijsktra.txt")
 
     dists = dijsktra_heap(_graph, 1)
     dists_naive, _ = dijsktra_naive(_graph, 1)
@@ -26,3 +41,31 @@ def test_dijsktra() -> None:
     keys = [7, 37, 59, 82, 99, 115, 133, 165, 188, 197]
     _expected = [2599, 2610, 2947, 2052, 2367, 2399, 2029, 2442, 2505, 3068]
     assert [dists[k] for k in keys] == _expected
+
+
+@pytest.mark.parametrize("heap_cls", [Heap, DaryHeap])
+def test_dijsktra_heap_engines(heap_cls: Type[Heap | DaryHeap]) -> None:
+    _graph = _random_graph()
+    dists_naive, _ = dijsktra_naive(_graph, 0)
+    assert dijsktra_heap(_graph, 0, heap_cls=heap_cls) == dists_naive
+
+
+def test_dijsktra_lazy() -> None:
+    _graph = _random_graph()
+    dists_naive, paths_naive = dijsktra_naive(_graph, 0)
+
+    dists, preds = dijsktra_lazy(_graph, 0)
+    assert dists == dists_naive
+    assert {v: path_to(preds, v) for v in dists} == paths_naive
+
+    # early exit: targets get their final distance, and we stop short
+    targets = [3, 7]
+    dists, preds = dijsktra_lazy(_graph, 0, targets=targets)
+    assert len(dists) < len(_graph)
+    for t in targets:
+        assert dists[t] == dists_naive[t]
+        assert path_to(preds, t) == paths_naive[t]
+
+    # sinks needn't be keys of the graph
+    dists, preds = dijsktra_lazy({1: [Edge(1, 2, 1.0)]}, 1)
+    assert dists == {1: 0.0, 2: 1.0} and preds == {1: None, 2: 1}
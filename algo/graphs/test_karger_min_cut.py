@@ -0,0 +1,131 @@
+"""Tests for Karger's min cut."""
+import random
+from collections import Counter
+from itertools import combinations
+from typing import List
+
+import pytest
+
+from .karger_min_cut import (
+    EdgeGraph,
+    EdgeSampler,
+    Graph,
+    _compute,
+    _init_worker,
+    _run_trials,
+    karger_stein_trials,
+    karger_trials,
+)
+
+AdjacencyList = List[List[int]]
+
+
+def _adj_l(edges: list[tuple[int, int]]) -> AdjacencyList:
+    rows: dict[int, list[int]] = {}
+    for u, v in edges:
+        rows.setdefault(u, [u]).append(v)
+        rows.setdefault(v, [v]).append(u)
+    return list(rows.values())
+
+
+@pytest.fixture
+def barbell() -> AdjacencyList:
+    """Two 6-cliques joined by a couple of bridges => min cut is 2."""
+    return _barbell(6)
+
+
+def _barbell(k: int) -> AdjacencyList:
+    left, right = range(0, k), range(k, 2 * k)
+    return _adj_l(
+        [
+            *combinations(left, 2),
+            *combinations(right, 2),
+            (0, k),
+            (1, k + 1),
+        ]
+    )
+
+
+def test_edge_graph(barbell: AdjacencyList) -> None:
+    g = EdgeGraph.from_adjacency_list(barbell)
+    assert len(g) == 12 and len(g.heads) == 2 * 15 + 2
+
+    rng = random.Random(42)
+    cuts = [g.search_min_cut(rng) for _ in range(200)]
+    assert min(cuts) == 2
+
+    # every trial ends up with a genuine 2-way cut
+    for _ in range(20):
+        uf = g.contract(rng)
+        assert uf.num_sets == 2
+        assert g.cut_size(uf) >= 2
+
+
+def test_run_trials(barbell: AdjacencyList) -> None:
+    _init_worker(barbell)
+    assert _run_trials((42, 200)) == (200, 2)
+    assert _run_trials((7, 50)) == _run_trials((7, 50))
+
+
+def test_karger_stein() -> None:
+    g = EdgeGraph.from_adjacency_list(_barbell(12))
+    rng = random.Random(42)
+    runs = karger_stein_trials(len(g), success=0.999)
+    assert min(g.search_min_cut_ks(rng) for _ in range(runs)) == 2
+
+    # contracting all the way down keeps parallel edges between supernodes
+    h = g.contracted(g.contract(rng, down_to=2))
+    assert len(h) == 2 and h.brute_min_cut() == len(h.heads)
+
+    _init_worker(_barbell(12))
+    assert _run_trials((42, runs), karger_stein=True) == (runs, 2)
+
+
+def test_brute_min_cut(barbell: AdjacencyList) -> None:
+    assert EdgeGraph.from_adjacency_list(barbell).brute_min_cut() == 2
+
+
+def test_trials() -> None:
+    assert karger_trials(200) > 100 * karger_stein_trials(200)
+    assert karger_stein_trials(200, 0.999) > karger_stein_trials(200, 0.9)
+
+
+def test_graph_min_cut(barbell: AdjacencyList) -> None:
+    cuts = [_compute(barbell, seed) for seed in range(100)]
+    assert min(cuts) == 2
+    assert cuts == [_compute(barbell, seed) for seed in range(100)]
+
+
+def test_edge_sampler() -> None:
+    # 0-1, 0-2, 1-2 with 0 and 1 merged into 3 => two parallel edges to 2
+    owner = {0: 3, 1: 3, 2: 2}
+    sampler = EdgeSampler([(0, 1), (0, 2), (1, 2)], rng=random.Random(42))
+    assert sampler.pick(owner.__getitem__) == (3, 2)
+    assert len(sampler) in (2, 3)
+
+    # picks are uniform over the surviving edges, multiplicity included
+    owner = {0: 0, 1: 1, 2: 2}
+    sampler = EdgeSampler([(0, 1), (0, 1), (0, 2)], rng=random.Random(42))
+    counts = Counter(sampler.pick(owner.__getitem__) for _ in range(3000))
+    assert 1800 < counts[0, 1] < 2200
+
+    # nothing left across supernodes
+    owner = {0: 0, 1: 0}
+    sampler = EdgeSampler([(0, 1), (1, 0)], rng=random.Random(42))
+    assert sampler.pick(owner.__getitem__) is None
+    assert len(sampler) == 0
+
+
+def test_select_random_edge(barbell: AdjacencyList) -> None:
+    g = Graph.from_adjacency_list(barbell, rng=random.Random(42))
+    for _ in range(100):
+        edge = g.select_random_edge()
+        assert edge is not None and edge[1] in g.graph[edge[0]]
+
+
+def test_disconnected() -> None:
+    adj_l = [[1, 2], [2, 1], [3, 4], [4, 3], [5, 6], [6, 5]]
+    for seed in range(10):
+        g = Graph.from_adjacency_list(adj_l, rng=random.Random(seed))
+        assert g.search_min_cut() == 0
+    assert EdgeGraph.from_adjacency_list(adj_l).search_min_cut() == 0
@@ -0,0 +1,95 @@
+"""Tests for the streaming graph loaders."""
+import os
+from pathlib import Path
+
+import pytest
+
+from .csr import CSRGraph
+from .dijkstra import Edge
+from .loaders import (
+    CACHE_SUFFIX,
+    iter_adj_l,
+    iter_edges,
+    load_adj_l,
+    load_dijkstra,
+    load_edges,
+    load_weighted,
+    read_csr,
+)
+
+
+def _as_dict(g: CSRGraph[int]) -> dict:
+    return {
+        g.names[v]: sorted(
+            (g.names[g.targets[i]], g.weights[i] if g.weights else None)
+            for i in range(g.offsets[v], g.offsets[v + 1])
+        )
+        for v in range(len(g))
+    }
+
+
+def test_load_edges(tmp_path: Path) -> None:
+    path = tmp_path / "edges.txt"
+    path.write_text("1 2\n\n2 3 \n3 1\n3 4\n")
+
+    assert list(iter_edges(path)) == [(1, 2), (2, 3), (3, 1), (3, 4)]
+    g = load_edges(path)
+    assert _as_dict(g) == {
+        1: [(2, None)],
+        2: [(3, None)],
+        3: [(1, None), (4, None)],
+        4: [],
+    }
+
+
+def test_load_adj_l(tmp_path: Path) -> None:
+    path = tmp_path / "adj.txt"
+    path.write_text("1\t2\t3\n2\t1\n3\t1\n4\n")
+
+    assert list(iter_adj_l(path)) == [[1, 2, 3], [2, 1], [3, 1], [4]]
+    assert len(load_adj_l(path)) == 4
+
+
+def test_load_weighted(tmp_path: Path) -> None:
+    path = tmp_path / "weighted.txt"
+    path.write_text("1 2,7 3,9\n2 3,1\n3\n")
+
+    assert _as_dict(load_weighted(path)) == {
+        1: [(2, 7.0), (3, 9.0)],
+        2: [(3, 1.0)],
+        3: [],
+    }
+    assert load_dijkstra(path) == {
+        1: [Edge(1, 2, 7.0), Edge(1, 3, 9.0)],
+        2: [Edge(2, 3, 1.0)],
+        3: [],
+    }
+
+
+def test_cache(tmp_path: Path) -> None:
+    path = tmp_path / "weighted.txt"
+    path.write_text("1 2,7 3,9\n2 3,1\n3 1,2.5\n")
+    cache_path = tmp_path / f"weighted.txt{CACHE_SUFFIX}"
+
+    g = load_weighted(path, cache=True)
+    assert cache_path.exists()
+    assert read_csr(cache_path) == g
+    assert load_weighted(path, cache=True) == g
+
+    # a newer input invalidates the cache
+    path.write_text("1 2,7\n")
+    os.utime(path, (cache_path.stat().st_mtime + 1,) * 2)
+    assert _as_dict(load_weighted(path, cache=True)) == {1: [(2, 7.0)], 2: []}
+
+    # a truncated cache gets rebuilt, and only the cache is left behind
+    _size = cache_path.stat().st_size
+    with open(cache_path, "r+b") as f:
+        f.truncate(_size - 8)
+    with pytest.raises(ValueError):
+        read_csr(cache_path)
+    assert _as_dict(load_weighted(path, cache=True)) == {1: [(2, 7.0)], 2: []}
+    assert cache_path.stat().st_size == _size
+    assert sorted(_.name for _ in tmp_path.iterdir()) == [
+        "weighted.txt",
+        f"weighted.txt{CACHE_SUFFIX}",
+    ]
@@ -0,0 +1,140 @@
+"""Tests for point-to-point shortest paths."""
+import math
+import random
+from collections import defaultdict
+from functools import partial
+from itertools import product
+from time import time
+from typing import Callable, Dict, Tuple
+
+import pytest
+
+from .dijkstra import Edge, Graph, dijsktra_lazy, reverse_graph
+from .point_to_point import (
+    Coords,
+    Query,
+    a_star,
+    dijsktra_bidi,
+    dijsktra_p2p,
+    euclidean,
+)
+
+
+def grid_graph(side: int, seed: int = 42) -> Tuple[Graph, Coords]:
+    """4-connected grid, edges at least as long as their euclidean span."""
+    rng = random.Random(seed)
+    g: Graph = {}
+    coords: Dict[int, Tuple[float, float]] = {}
+    for r in range(side):
+        for c in range(side):
+            v = r * side + c
+            coords[v], g[v] = (float(r), float(c)), []
+            for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                if 0 <= r + dr < side and 0 <= c + dc < side:
+                    w = (r + dr) * side + c + dc
+                    g[v].append(Edge(v, w, 1 + rng.random()))
+    return g, coords
+
+
+def geometric_graph(
+    n: int, radius: float, seed: int = 42
+) -> Tuple[Graph, Coords]:
+    """Random points in the unit square, linked when closer than radius."""
+    rng = random.Random(seed)
+    coords = {v: (rng.random(), rng.random()) for v in range(n)}
+
+    # bucket points into radius-sized cells to only compare neighbours
+    cells = defaultdict(list)
+    for v, (x, y) in coords.items():
+        cells[int(x / radius), int(y / radius)].append(v)
+
+    g: Graph = {v: [] for v in coords}
+    for v, (x, y) in coords.items():
+        for dx, dy in product((-1, 0, 1), repeat=2):
+            _cell = (int(x / radius) + dx, int(y / radius) + dy)
+            for w in cells.get(_cell, []):
+                d = math.dist(coords[v], coords[w])
+                if v != w and d <= radius:
+                    g[v].append(Edge(v, w, d))
+    return g, coords
+
+
+def _cost(g: Graph, s: int, q: Query) -> float:
+    cost, v = 0.0, s
+    for w in q.path:
+        cost += min(_.dist for _ in g[v] if _.tail == w)
+        v = w
+    return cost
+
+
+@pytest.mark.parametrize(
+    "g_coords",
+    [grid_graph(12), geometric_graph(300, 0.12)],
+    ids=["grid", "geometric"],
+)
+def test_point_to_point(g_coords: Tuple[Graph, Coords]) -> None:
+    g, coords = g_coords
+    g_rev = reverse_graph(g)
+    rng = random.Random(0)
+
+    for _ in range(20):
+        s, t = rng.choice(list(g)), rng.choice(list(g))
+        dists, _ = dijsktra_lazy(g, s)
+        expected = dists.get(t, math.inf)
+
+        for q in (
+            dijsktra_p2p(g, s, t),
+            dijsktra_bidi(g, g_rev, s, t),
+            a_star(g, s, t, heuristic=euclidean(coords, t)),
+        ):
+            assert q.dist == pytest.approx(expected)
+            if q.path:
+                assert q.path[-1] == t
+                assert _cost(g, s, q) == pytest.approx(expected)
+
+
+def test_reverse_graph() -> None:
+    g: Graph = {1: [Edge(1, 2, 3.0)], 2: [Edge(2, 3, 4.0)], 3: []}
+    assert reverse_graph(g) == {
+        1: [],
+        2: [Edge(2, 1, 3.0)],
+        3: [Edge(3, 2, 4.0)],
+    }
+
+    # sinks needn't be keys of either graph
+    g = {1: [Edge(1, 2, 3.0)], 2: [Edge(2, 3, 4.0)]}
+    g_rev = {2: [Edge(2, 1, 3.0)], 3: [Edge(3, 2, 4.0)]}
+    q = dijsktra_bidi(g, g_rev, 1, 3)
+    assert q.dist == 7.0 and q.path == [2, 3]
+
+
+def _a_star_euclidean(g: Graph, coords: Coords, s: int, t: int) -> Query:
+    return a_star(g, s, t, euclidean(coords, t))
+
+
+@pytest.mark.bench
+def test_speedup() -> None:
+    rng = random.Random(0)
+    for name, (g, coords) in (
+        ("grid", grid_graph(150)),
+        ("geometric", geometric_graph(20_000, 0.015)),
+    ):
+        g_rev, vertices = reverse_graph(g), list(g)
+        queries = [
+            (rng.choice(vertices), rng.choice(vertices)) for _ in range(20)
+        ]
+
+        engines: Dict[str, Callable[[int, int], Query]] = {
+            "dijkstra": partial(dijsktra_p2p, g),
+            "bidi": partial(dijsktra_bidi, g, g_rev),
+            "a*": partial(_a_star_euclidean, g, coords),
+        }
+        for engine, run in engines.items():
+            start_time, settled = time(), 0
+            for s, t in queries:
+                settled += run(s, t).settled
+            print(
+                f"{name} ({len(g)} vertices) {engine}: "
+                f"{settled / len(queries):.0f} settled, "
+                f"{(time() - start_time) / len(queries) * 1000:.2f}ms / query"
+            )
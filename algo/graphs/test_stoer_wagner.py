@@ -0,0 +1,78 @@
+"""Tests for the Stoer-Wagner min cut."""
+import random
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, tuples
+
+from ..heap.dary import DaryHeap
+from .karger_min_cut import EdgeGraph
+from .stoer_wagner import Cut, stoer_wagner, stoer_wagner_adj_l
+from .test_karger_min_cut import _barbell
+
+N = 8
+_EDGES = lists(tuples(integers(0, N - 1), integers(0, N - 1)), max_size=3 * N)
+
+
+def _crossing(edges: list[tuple[int, int, float]], cut: Cut) -> float:
+    return sum(w for u, v, w in edges if (u in cut.side) != (v in cut.side))
+
+
+@given(_EDGES)
+def test_stoer_wagner(pairs: list[tuple[int, int]]) -> None:
+    edges = [(u, v, 1.0) for u, v in pairs]
+    cut = stoer_wagner(edges, vertices=range(N))
+
+    # a genuine bipartition, as light as the lightest one
+    assert cut.side and cut.other and not cut.side & cut.other
+    assert cut.side | cut.other == set(range(N))
+    assert cut.value == _crossing(edges, cut)
+    nonloops = [(u, v) for u, v in pairs if u != v]
+    assert cut.value == EdgeGraph(nonloops, range(N)).brute_min_cut()
+    _dary = stoer_wagner(edges, vertices=range(N), heap_cls=DaryHeap)
+    assert _dary.value == cut.value
+
+
+def test_weighted() -> None:
+    # a heavy triangle hanging off a heavy square by two light edges
+    edges = [
+        (0, 1, 5.0),
+        (1, 2, 5.0),
+        (2, 0, 5.0),
+        (3, 4, 4.0),
+        (4, 5, 4.0),
+        (5, 6, 4.0),
+        (6, 3, 4.0),
+        (0, 3, 1.5),
+        (2, 5, 0.5),
+    ]
+    cut = stoer_wagner(edges)
+    assert cut.value == 2.0
+    assert {cut.side, cut.other} == {
+        frozenset({0, 1, 2}),
+        frozenset(range(3, 7)),
+    }
+
+    # parallel edges add up
+    assert stoer_wagner([*edges, (0, 3, 7.0)]).value == 8.0
+
+
+def test_barbell() -> None:
+    cut = stoer_wagner_adj_l(_barbell(30))
+    assert cut.value == 2
+    assert {cut.side, cut.other} == {
+        frozenset(range(30)),
+        frozenset(range(30, 60)),
+    }
+
+    # the ground truth the randomized search should eventually hit
+    g, rng = EdgeGraph.from_adjacency_list(_barbell(6)), random.Random(42)
+    assert min(g.search_min_cut(rng) for _ in range(200)) == 2
+    assert stoer_wagner_adj_l(_barbell(6)).value == 2
+
+
+def test_degenerate() -> None:
+    assert stoer_wagner([], vertices=[0, 1]).value == 0
+    assert stoer_wagner([(0, 0, 1.0), (1, 1, 1.0)]).value == 0
+    with pytest.raises(ValueError):
+        stoer_wagner([(0, 0, 1.0)])
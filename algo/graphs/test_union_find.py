@@ -0,0 +1,96 @@
+"""Tests for union-find."""
+import random
+from multiprocessing import Pool as ProcPool
+from multiprocessing.dummy import Pool
+from time import time
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, tuples
+from more_itertools import chunked
+
+from ._types import Graph
+from .bfs import bfs, connected_comps
+from .union_find import UnionFind, label_components
+
+N = 64
+_EDGES = lists(tuples(integers(0, N - 1), integers(0, N - 1)), max_size=2 * N)
+
+
+def _bfs_labels(edges: list[tuple[int, int]]) -> list[int]:
+    g, _ = Graph[int].from_edges(
+        [*edges, *((v, u) for u, v in edges), *((v, v) for v in range(N))]
+    )
+    labels = [-1] * N
+    for v in range(N):
+        if labels[v] < 0:
+            for w in bfs(g, v).color:
+                labels[w] = v
+    return labels
+
+
+def _same_partition(xs: list[int], ys: list[int]) -> bool:
+    return len(set(zip(xs, ys))) == len(set(xs)) == len(set(ys))
+
+
+@given(_EDGES)
+def test_union_find(edges: list[tuple[int, int]]) -> None:
+    uf = UnionFind.from_edges(N, edges)
+    labels = list(uf.labels())
+
+    assert _same_partition(labels, _bfs_labels(edges))
+    assert uf.num_sets == len(set(labels)) == len(uf.sets())
+
+
+@given(_EDGES)
+def test_label_components(edges: list[tuple[int, int]]) -> None:
+    with Pool(4) as pool:
+        uf = label_components(N, chunked(edges, 8), map_=pool.imap_unordered)
+    assert _same_partition(list(uf.labels()), _bfs_labels(edges))
+
+
+@given(_EDGES, _EDGES)
+def test_merge(
+    edges: list[tuple[int, int]], more: list[tuple[int, int]]
+) -> None:
+    uf, other = UnionFind.from_edges(N, edges), UnionFind.from_edges(N, more)
+    labels = list(uf.labels())
+
+    merged = uf + other
+    assert list(uf.labels()) == labels  # + leaves the operands alone
+    assert _same_partition(list(merged.labels()), _bfs_labels(edges + more))
+
+    uf += other
+    assert list(uf.labels()) == list(merged.labels())
+    assert uf.num_sets == merged.num_sets
+
+
+def test_connected_comps() -> None:
+    _adj_l = [
+        ["s", "a", "b"],
+        ["a", "s", "c"],
+        ["b", "s", "d"],
+        ["c", "a", "b", "e"],
+        ["d", "b", "e"],
+        ["e", "c", "d"],
+        ["f"],
+    ]
+    comps = list(connected_comps(Graph.from_adj_l(_adj_l)))
+    assert [set(_.vertices) for _ in comps] == [set("sabcde"), {"f"}]
+    assert set(comps[0].edges) == set("sabcde")
+
+
+@pytest.mark.bench
+def test_speedup() -> None:
+    n, m = 1_000_000, 2_000_000
+    rng = random.Random(42)
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+
+    start_time = time()
+    label_components(n, chunked(edges, m // 8))
+    print(f"Serial labeling time: {time() - start_time}")
+
+    start_time = time()
+    with ProcPool(8) as pool:
+        label_components(n, chunked(edges, m // 8), map_=pool.imap_unordered)
+    print(f"Pool labeling time: {time() - start_time}")
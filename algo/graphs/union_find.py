@@ -0,0 +1,103 @@
+"""Array-backed union-find (disjoint sets) over dense ids 0..n-1.
+
+Union by rank plus path halving keep every operation at practically
+constant amortized cost, and two forests over the same ids can be merged,
+so edge chunks can get labeled independently (e.g. in a process pool)
+and combined afterwards.
+"""
+from array import array
+from functools import partial, reduce
+from operator import iadd
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..abstract.dnc import SupportsMerge
+
+Edge = Tuple[int, int]
+
+
+class UnionFind(SupportsMerge["UnionFind"]):
+    parent: "array[int]"
+    rank: "array[int]"
+    num_sets: int
+
+    def __init__(self, n: int) -> None:
+        self.parent = array("q", range(n))
+        self.rank = array("B", bytes(n))
+        self.num_sets = n
+
+    @classmethod
+    def from_edges(cls, n: int, edges: Iterable[Edge]) -> "UnionFind":
+        uf = cls(n)
+        for u, v in edges:
+            uf.union(u, v)
+        return uf
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while (p := parent[x]) != x:
+            # path halving: point x at its grandparent and hop there
+            gp = parent[p]
+            parent[x] = gp
+            x = gp
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge the sets of x and y; return whether they were disjoint."""
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+
+        rank = self.rank
+        if rank[x] < rank[y]:
+            x, y = y, x
+        self.parent[y] = x
+        if rank[x] == rank[y]:
+            rank[x] += 1
+        self.num_sets -= 1
+        return True
+
+    def labels(self) -> "array[int]":
+        """Return the set representative of every id."""
+        return array("q", map(self.find, range(len(self))))
+
+    def sets(self) -> List[List[int]]:
+        """Return the members of every set, in order of their smallest id."""
+        _sets: Dict[int, List[int]] = {}
+        for x, root in enumerate(self.labels()):
+            _sets.setdefault(root, []).append(x)
+        return list(_sets.values())
+
+    def copy(self) -> "UnionFind":
+        uf = UnionFind(0)
+        uf.parent, uf.rank = array("q", self.parent), array("B", self.rank)
+        uf.num_sets = self.num_sets
+        return uf
+
+    def __add__(self, other: Optional["UnionFind"] = None) -> "UnionFind":
+        """Merge two forests into a new one, as other `SupportsMerge`s do."""
+        return self.copy().__iadd__(other)
+
+    def __iadd__(self, other: Optional["UnionFind"] = None) -> "UnionFind":
+        """Fold the other forest in: its parent links are just more edges."""
+        if other is not None:
+            for x, p in enumerate(other.parent):
+                if x != p:
+                    self.union(x, p)
+        return self
+
+
+def label_components(
+    n: int,
+    edge_chunks: Iterable[Iterable[Edge]],
+    map_: Callable = map,
+) -> UnionFind:
+    """Label every chunk separately through map_, then merge the forests.
+
+    Pass e.g. `pool.imap_unordered` as map_ to label chunks in parallel;
+    forests get folded in place (`+=`) into one as they come in.
+    """
+    forests = map_(partial(UnionFind.from_edges, n), edge_chunks)
+    return reduce(iadd, forests, UnionFind(n))
@@ -8,7 +8,8 @@ from typing import (
     Hashable,
     Iterable,
     List,
-    Optional, Protocol,
+    Optional,
+    Protocol,
     Tuple,
     TypeVar,
     Union,
@@ -43,14 +44,12 @@ class Heap(Generic[X]):
     @classmethod
     def from_iterable(cls, xs: Iterable[X]) -> "Heap[X]":
         _heap = cls()
-        for x in xs:
-            _heap.insert(x)
+        _heap.extend(xs)
         return _heap
 
     @classmethod
     def from_raw(cls, xs: list[X]) -> "Heap[X]":
-        _arr = xs[:]
-        return cls(_arr=_arr, _pos={v: k for k, v in enumerate(_arr)})
+        return cls.from_iterable(xs)
 
     def __bool__(self) -> bool:
         return bool(self._arr)
@@ -75,6 +74,40 @@ class Heap(Generic[X]):
         # Keep heap invariant -> bubble-up
         self._bubble_up(_next_leaf)
 
+    def extend(self, xs: Iterable[X]) -> None:
+        """Bulk insert.
+
+        Batches smaller than the heap go through `insert` (bubbling up a
+        random key is O(1) on average). Larger ones get appended as leaves
+        and the whole array is re-heapified bottom-up, in linear time.
+        """
+        xs = list(xs)
+        if len(xs) < len(self._arr):
+            for x in xs:
+                self.insert(x)
+            return
+
+        self._arr.extend(xs)
+        self._heapify()
+
+    def _heapify(self) -> None:
+        """Floyd's heap construction, then re-index positions in one go."""
+        arr = self._arr
+        keys, n = [_.key for _ in arr], len(arr)
+
+        for start in reversed(range(n // 2)):
+            i, x, key = start, arr[start], keys[start]
+            while (_child := 2 * i + 1) < n:
+                if _child + 1 < n and keys[_child + 1] <= keys[_child]:
+                    _child += 1
+                if key <= keys[_child]:
+                    break
+                arr[i], keys[i] = arr[_child], keys[_child]
+                i = _child
+            arr[i], keys[i] = x, key
+
+        self._pos = {x.name: i for i, x in enumerate(arr)}
+
     @property
     def root(self) -> Optional[X]:
         return self._arr[0] if self._arr else None
@@ -90,6 +123,10 @@ class Heap(Generic[X]):
         self._swap(_ind, -1)
         ret = self._poplast()
 
+        # if we deleted the last leaf => nothing left to fix
+        if _ind == len(self._arr):
+            return ret
+
         # if we deleted the root => invariably bubble down
         if _ind == 0:
             self._bubble_down()
@@ -104,6 +141,29 @@ class Heap(Generic[X]):
 
         return ret
 
+    def update_key(self, x: X) -> None:
+        """Replace the element named `x.name` by `x` and re-sift it."""
+        _ind = self._pos[x.name]
+        _old, self._arr[_ind] = self._arr[_ind], x
+
+        if x.key <= _old.key:
+            self._bubble_up(_ind)
+        else:
+            self._bubble_down(_ind)
+
+    def decrease_key(self, x: X) -> bool:
+        """Like `update_key`, but a no-op unless `x` has a smaller key.
+
+        Return whether the element got replaced.
+        """
+        _ind = self._pos[x.name]
+        if self._arr[_ind].key <= x.key:
+            return False
+
+        self._arr[_ind] = x
+        self._bubble_up(_ind)
+        return True
+
     def _bubble_up(self, leaf: int, up_to: int = 0) -> None:
         # we've reached the root
         if leaf == up_to:
@@ -0,0 +1,216 @@
+"""Array-backed d-ary indexed heap.
+
+Drop-in alternative to `algo.heap.Heap`: keys live in a compact
+`array('d')` next to a parallel array of dense element ids, so sifting
+only shuffles machine floats and ints around. Element names are interned
+to dense ids once, on insert, which keeps dict traffic off the hot path.
+
+Keys must be convertible to float.
+"""
+from array import array
+from itertools import repeat
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, cast
+
+from . import El, X
+
+
+def _fkey(x: El) -> float:
+    return cast(float, x.key)
+
+
+class DaryHeap(Generic[X]):
+    arity: int
+    _keys: "array[float]"  # heap position -> key
+    _ids: "array[int]"  # heap position -> element id
+    _where: "array[int]"  # element id -> heap position
+    _els: List[Optional[X]]  # element id -> element
+    _id_of: Dict[Hashable, int]  # element name -> element id
+    _free: List[int]  # recycled element ids
+
+    def __init__(self, arity: int = 4) -> None:
+        assert arity >= 2, f"arity should be at least 2, got {arity}"
+        self.arity = arity
+        self._keys = array("d")
+        self._ids = array("q")
+        self._where = array("q")
+        self._els = []
+        self._id_of = {}
+        self._free = []
+
+    @classmethod
+    def from_iterable(cls, xs: Iterable[X], arity: int = 4) -> "DaryHeap[X]":
+        _heap = cls(arity=arity)
+        _heap.extend(xs)
+        return _heap
+
+    @classmethod
+    def from_raw(cls, xs: list[X], arity: int = 4) -> "DaryHeap[X]":
+        return cls.from_iterable(xs, arity=arity)
+
+    def __bool__(self) -> bool:
+        return bool(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def parent(self, i: int) -> int:
+        return (i - 1) // self.arity
+
+    def children(self, i: int) -> range:
+        _first = self.arity * i + 1
+        return range(_first, min(_first + self.arity, len(self._ids)))
+
+    def insert(self, x: X) -> None:
+        _id = self._intern(x)
+        _next_leaf = len(self._ids)
+        self._keys.append(_fkey(x))
+        self._ids.append(_id)
+        self._where[_id] = _next_leaf
+
+        # Keep heap invariant -> sift-up
+        self._sift_up(_next_leaf)
+
+    def extend(self, xs: Iterable[X]) -> None:
+        """Bulk insert.
+
+        Batches smaller than the heap go through `insert`, larger ones get
+        appended as leaves and the whole array is re-heapified bottom-up.
+        """
+        xs = list(xs)
+        if len(xs) < len(self._ids):
+            for x in xs:
+                self.insert(x)
+            return
+
+        keys, ids, where = self._keys, self._ids, self._where
+        _new_ids = self._intern_all(xs)
+        for i, _id in enumerate(_new_ids, start=len(ids)):
+            where[_id] = i
+        keys.extend(map(_fkey, xs))
+        ids.extend(_new_ids)
+
+        # Floyd's heap construction: sift down every inner node, deepest first
+        for i in reversed(range(self.parent(len(ids) - 1) + 1)):
+            self._sift_down(i)
+
+    @property
+    def root(self) -> Optional[X]:
+        return self._els[self._ids[0]] if self._ids else None
+
+    def extract_min(self) -> X:
+        return self._remove_at(0)
+
+    def delete(self, x_name: Hashable) -> X:
+        return self._remove_at(self._where[self._id_of[x_name]])
+
+    def update_key(self, x: X) -> None:
+        """Replace the element named `x.name` by `x` and re-sift it."""
+        _id = self._id_of[x.name]
+        _ind, _key = self._where[_id], _fkey(x)
+        _old = self._keys[_ind]
+        self._els[_id] = x
+        self._keys[_ind] = _key
+
+        if _key < _old:
+            self._sift_up(_ind)
+        else:
+            self._sift_down(_ind)
+
+    def decrease_key(self, x: X) -> bool:
+        """Like `update_key`, but a no-op unless `x` has a smaller key.
+
+        Return whether the element got replaced.
+        """
+        _id = self._id_of[x.name]
+        _ind, _key = self._where[_id], _fkey(x)
+        if self._keys[_ind] <= _key:
+            return False
+
+        self._els[_id] = x
+        self._keys[_ind] = _key
+        self._sift_up(_ind)
+        return True
+
+    def _remove_at(self, i: int) -> X:
+        keys, ids = self._keys, self._ids
+        _id = ids[i]
+
+        # plug the hole with the last leaf, then restore the invariant
+        _key, _replace = keys.pop(), ids.pop()
+        if i < len(ids):
+            keys[i], ids[i] = _key, _replace
+            self._where[_replace] = i
+            if i and _key < keys[self.parent(i)]:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+
+        return self._release(_id)
+
+    def _sift_up(self, i: int) -> None:
+        keys, ids, where, d = self._keys, self._ids, self._where, self.arity
+        key, _id = keys[i], ids[i]
+
+        # move parents down into the hole until the key fits
+        while i:
+            _parent = (i - 1) // d
+            if keys[_parent] <= key:
+                break
+            keys[i] = keys[_parent]
+            ids[i] = _moved = ids[_parent]
+            where[_moved] = i
+            i = _parent
+
+        keys[i], ids[i], where[_id] = key, _id, i
+
+    def _sift_down(self, i: int) -> None:
+        keys, ids, where, d = self._keys, self._ids, self._where, self.arity
+        key, _id, n = keys[i], ids[i], len(keys)
+
+        # move the smallest child up into the hole until the key fits
+        while (_first := d * i + 1) < n:
+            # slicing + min/index keeps the child scan in C
+            _siblings = keys[_first : _first + d]
+            _min = min(_siblings)
+            if key <= _min:
+                break
+            _child = _first + _siblings.index(_min)
+            keys[i] = _min
+            ids[i] = _moved = ids[_child]
+            where[_moved] = i
+            i = _child
+
+        keys[i], ids[i], where[_id] = key, _id, i
+
+    def _intern(self, x: X) -> int:
+        if self._free:
+            _id = self._free.pop()
+            self._els[_id] = x
+        else:
+            _id = len(self._els)
+            self._els.append(x)
+            self._where.append(-1)
+        self._id_of[x.name] = _id
+        return _id
+
+    def _intern_all(self, xs: List[X]) -> List[int]:
+        _reused = min(len(self._free), len(xs))
+        _ids = [self._intern(x) for x in xs[:_reused]]
+
+        # whatever is left gets a contiguous block of fresh ids
+        _fresh, _base = xs[_reused:], len(self._els)
+        _fresh_ids = range(_base, _base + len(_fresh))
+        self._els.extend(_fresh)
+        self._where.extend(repeat(-1, len(_fresh)))
+        self._id_of.update(zip((x.name for x in _fresh), _fresh_ids))
+        _ids.extend(_fresh_ids)
+        return _ids
+
+    def _release(self, _id: int) -> X:
+        x = self._els[_id]
+        assert x is not None
+        self._els[_id] = None
+        self._where[_id] = -1
+        self._free.append(_id)
+        del self._id_of[x.name]
+        return x
@@ -1,8 +1,9 @@
 import time
 from pathlib import Path
-from typing import Iterable, List, NamedTuple
+from typing import Iterable, List, NamedTuple, Type, Union
 
 from algo.heap import Heap
+from algo.heap.dary import DaryHeap
 
 
 def naive_median(numbers: List[int]) -> Iterable[int]:
@@ -40,7 +41,10 @@ class MaxInt(NamedTuple):
         return self.key
 
 
-def heap_median(numbers: List[int]) -> Iterable[int]:
+def heap_median(
+    numbers: List[int],
+    heap_cls: Type[Union[Heap, DaryHeap]] = Heap,
+) -> Iterable[int]:
     if not numbers:
         return []
 
@@ -52,7 +56,7 @@ def heap_median(numbers: List[int]) -> Iterable[int]:
             if numbers[0] < numbers[1]
             else (numbers[1], numbers[0])
         )
-        min_heap, max_heap = Heap[MinInt](), Heap[MaxInt]()
+        min_heap, max_heap = heap_cls(), heap_cls()
         min_heap.insert(MinInt(min_root))
         max_heap.insert(MaxInt(max_root))
         yield max_heap.root.el
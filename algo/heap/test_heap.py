@@ -1,11 +1,19 @@
 """Tests for heap."""
+import heapq
+import random
 from random import randrange
-from typing import NamedTuple
+from time import time
+from typing import NamedTuple, Type
 
+import pytest
 from hypothesis import given
 from hypothesis.strategies import integers, lists
 
 from . import Heap
+from .dary import DaryHeap
+
+# keys go through array('d') in DaryHeap => keep them exactly representable
+_F_INTS = integers(min_value=-(2**53), max_value=2**53)
 
 
 class KInt(NamedTuple):
@@ -39,3 +47,138 @@ def test_heap_delete(ints: list[int]) -> None:
     while heap:
         _mins.append(heap.extract_min().key)
     assert _mins == _sorted, f"falsifying: {ints}"
+
+
+@pytest.mark.parametrize("arity", [2, 4, 8])
+@given(lists(_F_INTS, min_size=8, max_size=128, unique=True))
+def test_dary_heap_sort(arity: int, ints: list[int]) -> None:
+    heap = DaryHeap[KInt].from_iterable([KInt(_) for _ in ints], arity=arity)
+
+    _mins = list()
+    while heap:
+        _mins.append(heap.extract_min().key)
+    assert _mins == sorted(ints), f"falsifying: {ints}"
+
+
+@pytest.mark.parametrize("arity", [2, 4, 8])
+@given(lists(_F_INTS, min_size=8, max_size=128, unique=True))
+def test_dary_heap_delete(arity: int, ints: list[int]) -> None:
+    _sorted = sorted(ints)
+    heap = DaryHeap[KInt].from_iterable([KInt(_) for _ in ints], arity=arity)
+
+    for _ in range(len(ints) // 2):
+        heap.delete(_sorted.pop(randrange(0, len(_sorted))))
+    # deleted names can be re-inserted
+    heap.delete(_sorted[0])
+    heap.insert(KInt(_sorted[0]))
+
+    _mins = list()
+    while heap:
+        _mins.append(heap.extract_min().key)
+    assert _mins == _sorted, f"falsifying: {ints}"
+
+
+@pytest.mark.bench
+def test_speedup() -> None:
+    _size = 100_000
+    keys = random.sample(range(0, 100 * _size), _size)
+    victims = random.sample(keys, _size // 4)
+
+    def _run(heap: Heap | DaryHeap) -> None:
+        for k in keys:
+            heap.insert(KInt(k))
+        for k in victims:
+            heap.delete(k)
+        while heap:
+            heap.extract_min()
+
+    start_time = time()
+    _run(Heap())
+    print(f"Heap time: {time() - start_time}")
+
+    for arity in (2, 4, 8):
+        start_time = time()
+        _run(DaryHeap(arity=arity))
+        print(f"DaryHeap({arity=}) time: {time() - start_time}")
+
+    # heapq has no delete => lazily skip the victims on pop
+    start_time = time()
+    _heap: list[int] = []
+    for k in keys:
+        heapq.heappush(_heap, k)
+    _deleted = set(victims)
+    while _heap:
+        if heapq.heappop(_heap) in _deleted:
+            continue
+    print(f"heapq time: {time() - start_time}")
+
+
+class Named(NamedTuple):
+    name: int
+    key: int
+
+
+@pytest.mark.parametrize("heap_cls", [Heap, DaryHeap])
+@given(
+    lists(_F_INTS, min_size=8, max_size=128, unique=True),
+    lists(_F_INTS, min_size=8, max_size=128),
+)
+def test_heap_update_key(
+    heap_cls: Type[Heap | DaryHeap], ints: list[int], new: list[int]
+) -> None:
+    keys = dict(enumerate(ints))
+    heap = heap_cls.from_iterable([Named(*_) for _ in keys.items()])
+
+    for name, key in zip(range(len(ints)), new):
+        if name % 2:
+            heap.update_key(Named(name, key))
+            keys[name] = key
+        else:
+            replaced = heap.decrease_key(Named(name, key))
+            assert replaced == (key < keys[name])
+            keys[name] = min(keys[name], key)
+
+    _mins = list()
+    while heap:
+        _mins.append(heap.extract_min().key)
+    assert _mins == sorted(keys.values()), f"falsifying: {ints}, {new}"
+
+
+@pytest.mark.parametrize("heap_cls", [Heap, DaryHeap])
+@given(
+    lists(_F_INTS, max_size=128, unique=True),
+    lists(_F_INTS, max_size=128, unique=True),
+)
+def test_heap_extend(
+    heap_cls: Type[Heap | DaryHeap], xs: list[int], ys: list[int]
+) -> None:
+    ys = [_ for _ in ys if _ not in set(xs)]
+    heap = heap_cls.from_raw([KInt(_) for _ in xs])
+    heap.extend(KInt(_) for _ in ys)
+
+    # positions are keyed by name
+    _sorted = sorted([*xs, *ys])
+    if _sorted:
+        heap.delete(_sorted.pop(randrange(0, len(_sorted))))
+
+    _mins = list()
+    while heap:
+        _mins.append(heap.extract_min().key)
+    assert _mins == _sorted, f"falsifying: {xs}, {ys}"
+
+
+@pytest.mark.bench
+def test_bulk_load_speedup() -> None:
+    _size = 200_000
+    xs = [KInt(_) for _ in random.sample(range(0, 100 * _size), _size)]
+
+    for heap_cls in (Heap, DaryHeap):
+        start_time = time()
+        _heap: Heap | DaryHeap = heap_cls()
+        for x in xs:
+            _heap.insert(x)
+        print(f"{heap_cls.__name__} insert time: {time() - start_time}")
+
+        start_time = time()
+        heap_cls.from_iterable(xs)
+        print(f"{heap_cls.__name__} heapify time: {time() - start_time}")
@@ -1,16 +1,94 @@
 """
 Count the number of inversions in an array by piggybacking on MergeSort
+
+`InvCount.merge` combines any number of operands through a heap: an
+element popped from run r is inverted with whatever is left of runs
+0..r-1, and a Fenwick tree over the run sizes keeps that count at
+O(log k) per element. Numeric operands get folded through NumPy merges
+instead, `np.searchsorted` counting how many merged values each run goes
+past.
+
+`InvCount.from_values` counts a whole sequence at once, with the
+bottom-up engine of `merge_sort` (`sort_count`), or through the NumPy
+fast path of `algo.vectorized` for numeric input when NumPy is around.
+`InvCount.parallel` has workers count chunks that way, and merges their
+results in a single k-way pass, which only adds the inversions across
+chunks.
+
+`StreamInvCount` doesn't need the whole sequence up front: values come
+from a universe known in advance, get compressed to dense ranks, and a
+Fenwick tree over the ranks of the values seen so far says how many of
+them are greater (or smaller) than the next one in O(log n). So the count
+follows a stream as values arrive, or a sliding window as values come and
+go, without ever re-sorting. `inv_per_element` uses the same trick to
+tell how many inversions every element of a sequence takes part in.
 """
+from array import array
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass, replace
-from typing import Generic, List, Optional, TypeVar
+from functools import partial
+from heapq import heapify, heappop, heapreplace
+from typing import (
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
-from .abstract.dnc import SupportsMerge
+from . import vectorized
+from .abstract.dnc import SupportsKMerge, solve_chunks
+from .abstract.protocols import SupportsLessThan
+from .sorting.merge_sort import sort_count
 
 X = TypeVar("X")
+Y = TypeVar("Y", bound=SupportsLessThan)
+
+
+class Fenwick:
+    """Binary indexed tree: prefix sums of counts[0..n-1], point updates."""
+
+    tree: "array[int]"
+
+    def __init__(self, n: int) -> None:
+        self.tree = array("q", bytes(8 * (n + 1)))
+
+    @classmethod
+    def from_counts(cls, counts: Iterable[int]) -> "Fenwick":
+        """Build in linear time: every node pushes its sum to its parent."""
+        _counts = list(counts)
+        fenwick = cls(len(_counts))
+        tree = fenwick.tree
+        tree[1:] = array("q", _counts)
+        for i in range(1, len(tree)):
+            if (parent := i + (i & -i)) < len(tree):
+                tree[parent] += tree[i]
+        return fenwick
+
+    def __len__(self) -> int:
+        return len(self.tree) - 1
+
+    def add(self, i: int, delta: int = 1) -> None:
+        tree, i = self.tree, i + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i: int) -> int:
+        """Return counts[0] + ... + counts[i - 1]."""
+        tree, total = self.tree, 0
+        while i:
+            total += tree[i]
+            i -= i & -i
+        return total
 
 
 @dataclass(frozen=True)
-class InvCount(SupportsMerge["InvCount"], Generic[X]):
+class InvCount(SupportsKMerge["InvCount"], Generic[X]):
     values: List[X]
     inv_count: int = 0
 
@@ -18,6 +96,35 @@ class InvCount(SupportsMerge["InvCount"], Generic[X]):
     def pure(cls, x: X) -> "InvCount[X]":
         return cls([x])
 
+    @classmethod
+    def from_values(
+        cls, xs: Iterable[X], vectorize: bool = True
+    ) -> "InvCount[X]":
+        """Same as dnc over `InvCount.pure`, minus the wrappers."""
+        if vectorize and (a := vectorized.as_array(xs)) is not None:
+            return cls(
+                vectorized.merge_sort(a).tolist(), vectorized.inv_count(a)
+            )
+        return cls(*sort_count(xs))
+
+    @classmethod
+    def parallel(
+        cls,
+        xs: Sequence[X],
+        chunks: Optional[int] = None,
+        map_: Optional[Callable] = None,
+        vectorize: bool = True,
+    ) -> "InvCount[X]":
+        """Count chunks in a process pool, then add the cross-chunk ones.
+
+        See `parallel_divide_and_conquer` for chunks and map_.
+        """
+        _leaf = partial(cls.from_values, vectorize=vectorize)
+        _counted = solve_chunks(xs, _leaf, chunks=chunks, map_=map_)
+        if not _counted:
+            return cls([])
+        return _counted[0].merge(*_counted[1:], vectorize=vectorize)
+
     def __len__(self) -> int:
         return len(self.values)
 
@@ -48,3 +155,125 @@ class InvCount(SupportsMerge["InvCount"], Generic[X]):
             values=output,
             inv_count=(self.inv_count + other.inv_count + inv_count),
         )
+
+    def merge(self, *others: "InvCount", vectorize: bool = True) -> "InvCount":
+        """K-way merge, counting the inversions across operands.
+
+        Numeric operands get merged through `vectorized.merge_count` when
+        NumPy is around, others through a heap.
+        """
+        if not others:
+            return self
+
+        runs = [self, *others]
+        if vectorize and (
+            arrays := vectorized.as_arrays([run.values for run in runs])
+        ):
+            merged, across = vectorized.merge_count(arrays)
+            return replace(
+                self,
+                values=merged.tolist(),
+                inv_count=sum(run.inv_count for run in runs) + across,
+            )
+
+        left = Fenwick.from_counts(map(len, runs))  # what's left per run
+
+        # equal values pop in run order => only strictly greater ones count
+        heap = [(run.values[0], r, 0) for r, run in enumerate(runs) if run]
+        heapify(heap)
+        output: List[X] = []
+        inv_count = sum(run.inv_count for run in runs)
+        while heap:
+            x, r, i = heap[0]
+            output.append(x)
+
+            # take x off its run, then count what's left in runs before it
+            left.add(r, -1)
+            inv_count += left.prefix(r)
+
+            if i + 1 < len(runs[r]):
+                heapreplace(heap, (runs[r].values[i + 1], r, i + 1))
+            else:
+                heappop(heap)
+
+        return replace(self, values=output, inv_count=inv_count)
+
+
+class StreamInvCount(Generic[Y]):
+    """Inversion count of a stream, or of a sliding window over one.
+
+    Every value has to come from `universe`. With a `window` size, the
+    oldest value gets evicted whenever a new one would overflow it.
+    """
+
+    keys: List[Y]  # rank -> value
+    counts: Fenwick  # rank -> how many of it are in the window
+    values: Deque[Y]
+    window: Optional[int]
+    inv_count: int
+
+    def __init__(
+        self, universe: Iterable[Y], window: Optional[int] = None
+    ) -> None:
+        assert window is None or window >= 1, f"bad window size {window}"
+        self.keys = sorted(set(universe))
+        self.counts = Fenwick(len(self.keys))
+        self.values = deque()
+        self.window = window
+        self.inv_count = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def rank(self, x: Y) -> int:
+        r = bisect_left(self.keys, x)
+        if r == len(self.keys) or self.keys[r] != x:
+            raise ValueError(f"{x!r} is not in the universe")
+        return r
+
+    def greater(self, x: Y) -> int:
+        """How many values in the window are greater than x."""
+        return len(self) - self.counts.prefix(self.rank(x) + 1)
+
+    def less(self, x: Y) -> int:
+        """How many values in the window are less than x."""
+        return self.counts.prefix(self.rank(x))
+
+    def append(self, x: Y) -> int:
+        """Add x at the end; return the inversions it adds."""
+        if self.window is not None and len(self) == self.window:
+            self.popleft()
+
+        added = self.greater(x)
+        self.counts.add(self.rank(x))
+        self.values.append(x)
+        self.inv_count += added
+        return added
+
+    def extend(self, xs: Iterable[Y]) -> None:
+        for x in xs:
+            self.append(x)
+
+    def popleft(self) -> Y:
+        """Evict the oldest value, along with the inversions it was in."""
+        x = self.values.popleft()
+        self.counts.add(self.rank(x), -1)
+        self.inv_count -= self.less(x)
+        return x
+
+
+def inv_per_element(xs: Iterable[Y]) -> List[int]:
+    """For every element, count the inversions it takes part in.
+
+    That's the greater elements before it plus the smaller ones after it;
+    the total is twice the inversion count.
+    """
+    _xs = list(xs)
+    stream = StreamInvCount(_xs)
+    involved = [stream.append(x) for x in _xs]
+
+    stream = StreamInvCount(_xs)
+    for i in reversed(range(len(_xs))):
+        involved[i] += stream.less(_xs[i])
+        stream.append(_xs[i])
+    return involved
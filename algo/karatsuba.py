@@ -1,11 +1,22 @@
-"""Karatsuba multiplication."""
-from typing import Tuple
+"""Karatsuba multiplication.
+
+`karatsuba_mul` splits decimal strings, which pays for base conversions
+at every level. `karatsuba_mul_bits` splits on bit boundaries instead,
+hands small operands to the native multiplication, and can take Toom-3
+steps for very large ones.
+"""
+from functools import partial
+from typing import Optional, Tuple
 
 
 def _split_at(x: str, at: int) -> Tuple[int, int]:
     return int(x[:at]), int(x[at:])
 
 
+def _split_bits(x: int, at: int) -> Tuple[int, int]:
+    return x >> at, x & ((1 << at) - 1)
+
+
 def karatsuba_mul(x: int, y: int) -> int:
     """Sneaky Karatsuba."""
 
@@ -31,3 +42,84 @@ def karatsuba_mul(x: int, y: int) -> int:
     z2 = karatsuba_mul(high1, high2)
 
     return z2 * pow(10, (m2 * 2)) + (z1 - z2 - z0) * pow(10, m2) + z0
+
+
+# in bits; CPython already multiplies big ints with Karatsuba past ~2100
+# bits, so below these splitting only adds overhead (see `test_crossover`)
+KARATSUBA_THRESHOLD = 8192
+TOOM3_THRESHOLD = 1 << 18
+
+
+def karatsuba_mul_bits(
+    x: int,
+    y: int,
+    threshold: int = KARATSUBA_THRESHOLD,
+    toom3_threshold: Optional[int] = None,
+) -> int:
+    """Karatsuba splitting on bit boundaries, with shifts and masks.
+
+    Operands of at most `threshold` bits get multiplied natively. Given a
+    `toom3_threshold`, operands past it get split in three instead.
+    """
+    if x < 0 or y < 0:
+        _abs = karatsuba_mul_bits(abs(x), abs(y), threshold, toom3_threshold)
+        return -_abs if (x < 0) != (y < 0) else _abs
+
+    # an unbalanced split buys nothing => native beyond the threshold too
+    if min(x.bit_length(), y.bit_length()) <= threshold:
+        return x * y
+
+    n = max(x.bit_length(), y.bit_length())
+    if toom3_threshold is not None and n > toom3_threshold:
+        return _toom3(x, y, n, threshold, toom3_threshold)
+
+    # split the bit sequences in the middle
+    half = n // 2
+    high1, low1 = _split_bits(x, half)
+    high2, low2 = _split_bits(y, half)
+
+    # 3 recursive calls for numbers approximately half the size
+    _mul = partial(
+        karatsuba_mul_bits,
+        threshold=threshold,
+        toom3_threshold=toom3_threshold,
+    )
+    z0 = _mul(low1, low2)
+    z1 = _mul(low1 + high1, low2 + high2)
+    z2 = _mul(high1, high2)
+
+    return (z2 << (2 * half)) + ((z1 - z2 - z0) << half) + z0
+
+
+def _toom3(
+    x: int, y: int, n: int, threshold: int, toom3_threshold: int
+) -> int:
+    """Toom-3: 5 multiplications of a third the size, instead of 9."""
+    k = -(-n // 3)
+
+    # evaluate both polynomials at 0, 1, -1, -2 and infinity, multiply
+    _mul = partial(
+        karatsuba_mul_bits,
+        threshold=threshold,
+        toom3_threshold=toom3_threshold,
+    )
+    r0, r1, r_1, r_2, r_inf = map(_mul, _evaluate(x, k), _evaluate(y, k))
+
+    # interpolate back the coefficients (Bodrato's sequence, exact divisions)
+    c3 = (r_2 - r1) // 3
+    c1 = (r1 - r_1) // 2
+    c2 = r_1 - r0
+    c3 = (c2 - c3) // 2 + 2 * r_inf
+    c2 = c2 + c1 - r_inf
+    c1 = c1 - c3
+
+    return (
+        r0 + (c1 << k) + (c2 << (2 * k)) + (c3 << (3 * k)) + (r_inf << (4 * k))
+    )
+
+
+def _evaluate(x: int, k: int) -> Tuple[int, int, int, int, int]:
+    """Split x in k-bit thirds; evaluate them at 0, 1, -1, -2 and infinity."""
+    rest, x0 = _split_bits(x, k)
+    x2, x1 = _split_bits(rest, k)
+    return x0, x0 + x1 + x2, x0 - x1 + x2, x0 - 2 * x1 + 4 * x2, x2
@@ -0,0 +1,133 @@
+"""
+Kendall rank correlation (tau-b) and distance, by counting inversions.
+
+Knight's algorithm: sort the pairs by x (then y), and the discordant pairs
+are exactly the inversions of the ys in that order, which
+`InvCount.from_values` counts in O(n log n) without wrapping anything.
+Ties on either side get netted out of tau-b's denominator.
+
+Everything that only depends on the reference side (its order, its tie
+groups) gets computed once by `KendallTau`, so comparing many rankings
+against the same reference only pays for the inversion counts.
+"""
+import math
+from itertools import groupby
+from typing import (
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from .abstract.protocols import SupportsLessThan
+from .inv_count import InvCount
+
+Y = TypeVar("Y", bound=SupportsLessThan)
+
+
+class KendallTau(Generic[Y]):
+    order: List[int]  # positions of the reference, by increasing value
+    tie_groups: List[slice]  # runs of equal values in that order
+    x_ties: int  # pairs tied in the reference
+    index: Dict[Hashable, int]  # item -> position, for orderings
+
+    def __init__(self, reference: Sequence[Y]) -> None:
+        self.index = {}
+        self.order = sorted(range(len(reference)), key=reference.__getitem__)
+        self.tie_groups, self.x_ties, start = [], 0, 0
+        for _, group in groupby(self.order, key=reference.__getitem__):
+            size = sum(1 for _ in group)
+            if size > 1:
+                self.tie_groups.append(slice(start, start + size))
+                self.x_ties += size * (size - 1) // 2
+            start += size
+
+    @classmethod
+    def from_ordering(cls, ordering: Sequence[Hashable]) -> "KendallTau[int]":
+        """Reference given as its items, best first; see `positions`."""
+        kt = cast(Type[KendallTau[int]], cls)(range(len(ordering)))
+        kt.index = {item: i for i, item in enumerate(ordering)}
+        if len(kt.index) != len(ordering):
+            raise ValueError("the reference ordering repeats items")
+        return kt
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def positions(self, ordering: Iterable[Hashable]) -> List[int]:
+        """Turn another ordering of the reference items into scores.
+
+        It must rank each reference item exactly once.
+        """
+        scores, n = [-1] * len(self), 0
+        for n, item in enumerate(ordering, 1):
+            if (at := self.index.get(item)) is None:
+                raise ValueError(f"{item!r} isn't in the reference ordering")
+            if scores[at] >= 0:
+                raise ValueError(f"{item!r} is ranked twice")
+            scores[at] = n - 1
+        # no repeats, so any length mismatch leaves items unranked
+        if n != len(self):
+            raise ValueError(f"expected {len(self)} items, got {n}")
+        return scores
+
+    def distance(self, ys: Sequence[SupportsLessThan]) -> int:
+        """Number of discordant pairs, ties excluded."""
+        return self._count(ys)[0].inv_count
+
+    def tau(self, ys: Sequence[SupportsLessThan]) -> float:
+        """Kendall's tau-b; NaN if either side is constant."""
+        counted, xy_ties = self._count(ys)
+        n_pairs = len(self) * (len(self) - 1) // 2
+        y_ties = _tied_pairs(counted.values)
+
+        # concordant - discordant, out of the pairs untied on each side
+        _diff = (
+            n_pairs - self.x_ties - y_ties + xy_ties - 2 * counted.inv_count
+        )
+        _norm = (n_pairs - self.x_ties) * (n_pairs - y_ties)
+        return _diff / math.sqrt(_norm) if _norm else math.nan
+
+    def taus(self, yss: Iterable[Sequence[SupportsLessThan]]) -> List[float]:
+        return [self.tau(ys) for ys in yss]
+
+    def distances(
+        self, yss: Iterable[Sequence[SupportsLessThan]]
+    ) -> List[int]:
+        return [self.distance(ys) for ys in yss]
+
+    def _count(self, ys: Sequence[SupportsLessThan]) -> Tuple[InvCount, int]:
+        """Count the inversions of ys by reference order, and xy ties."""
+        if len(ys) != len(self):
+            raise ValueError(f"expected {len(self)} values, got {len(ys)}")
+
+        # ties in the reference get broken by y => they never count
+        by_x: List = [ys[i] for i in self.order]
+        xy_ties = 0
+        for group in self.tie_groups:
+            by_x[group] = sorted(by_x[group])
+            xy_ties += _tied_pairs(by_x[group])
+        return InvCount.from_values(by_x), xy_ties
+
+
+def kendall_tau(xs: Sequence[Y], ys: Sequence[SupportsLessThan]) -> float:
+    """Kendall's tau-b between paired scores."""
+    return KendallTau(xs).tau(ys)
+
+
+def kendall_tau_distance(
+    xs: Sequence[Y], ys: Sequence[SupportsLessThan]
+) -> int:
+    """Number of pairs the two sides order differently."""
+    return KendallTau(xs).distance(ys)
+
+
+def _tied_pairs(sorted_values: Iterable) -> int:
+    sizes = (sum(1 for _ in group) for _, group in groupby(sorted_values))
+    return sum(size * (size - 1) // 2 for size in sizes)
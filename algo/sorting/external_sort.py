@@ -0,0 +1,131 @@
+"""
+External (out-of-core) merge sort for streams of ints or floats.
+
+The input gets cut into runs that fit the memory budget, every run is
+read into an `array`, sorted and spilled to a temp file as raw machine
+values (`array.tofile`). Runs are then streamed back through a heap-based
+k-way merge, reading each one in fixed size blocks; when there are too
+many runs for the budget to give each of them a decent block, groups of
+them get merged into longer runs first.
+
+With NumPy around, runs get sorted in place inside their array, so the
+budget holds as many values as fit in it in binary form. Without, sorting
+goes through the bottom-up `merge_sort` engine, whose Python objects and
+two buffers cost about `PY_VALUE` bytes per value on top, and runs get
+that much shorter.
+"""
+import heapq
+import tempfile
+from array import array
+from itertools import islice
+from pathlib import Path
+from typing import Generator, Iterable, Iterator, List, Optional, Union
+
+from more_itertools import chunked
+
+from .. import vectorized
+from .merge_sort import merge_sort
+
+Number = Union[int, float]
+DEFAULT_MEMORY = 64 << 20
+MIN_BLOCK = 1 << 12  # values read per run and per refill, at the least
+PY_VALUE = 64  # an int / float object, and a slot in each merge buffer
+
+
+def external_sort(
+    xs: Iterable[Number],
+    memory: int = DEFAULT_MEMORY,
+    typecode: str = "q",
+    tmp_dir: Optional[Path] = None,
+) -> Generator[Number, None, None]:
+    """Yield xs in sorted order, holding about `memory` bytes of values.
+
+    Values have to fit the array typecode ("q" for 64-bit ints, "d" for
+    floats). Temp files live in tmp_dir (or the system default) and get
+    removed once the generator is exhausted or closed.
+    """
+    itemsize = array(typecode).itemsize
+    footprint = itemsize if vectorized.HAS_NUMPY else 2 * itemsize + PY_VALUE
+    run_len = max(memory // footprint, 1)
+    fan_in = max(memory // (itemsize * MIN_BLOCK) - 1, 2)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as _tmp:
+        _xs = iter(xs)
+        runs: List[Path] = []
+        while run := _read_run(_xs, typecode, run_len):
+            _path = Path(_tmp) / f"run{len(runs)}"
+            runs.append(write_values(_path, _sort_run(run), typecode))
+            del run
+
+        # one more pass for every factor of fan_in runs too many
+        n_pass = 0
+        while len(runs) > fan_in:
+            n_pass += 1
+            runs = [
+                _merge_runs(
+                    Path(_tmp) / f"pass{n_pass}-{i}", group, typecode, run_len
+                )
+                for i, group in enumerate(chunked(runs, fan_in))
+            ]
+
+        block = max(run_len // (len(runs) + 1), 1)
+        yield from heapq.merge(
+            *(read_values(_, typecode, block) for _ in runs)
+        )
+
+
+def write_values(
+    path: Path, xs: Iterable[Number], typecode: str = "q"
+) -> Path:
+    """Write xs as raw machine values; return the path."""
+    with open(path, "wb") as f:
+        if isinstance(xs, array) and xs.typecode == typecode:
+            xs.tofile(f)
+            return path
+        for chunk in chunked(xs, MIN_BLOCK):
+            array(typecode, chunk).tofile(f)
+    return path
+
+
+def read_values(
+    path: Path, typecode: str = "q", block: int = MIN_BLOCK
+) -> Iterator[Number]:
+    """Stream the values of a file, reading `block` of them at a time."""
+    buf = array(typecode, [0]) * block
+    with open(path, "rb") as f, memoryview(buf) as _view:
+        _bytes = _view.cast("B")
+        while n := f.readinto(_bytes) // buf.itemsize:
+            yield from islice(buf, n)
+
+
+def _read_run(xs: Iterator[Number], typecode: str, run_len: int) -> array:
+    """Read up to run_len values into an array allocated once."""
+    run: array = array(typecode, [0]) * run_len
+    n = 0
+    for chunk in chunked(islice(xs, run_len), MIN_BLOCK):
+        run[n : n + len(chunk)] = array(typecode, chunk)
+        n += len(chunk)
+    del run[n:]
+    return run
+
+
+def _sort_run(run: array) -> array:
+    """Sort in place through NumPy, or into a new array otherwise."""
+    if vectorized.HAS_NUMPY:
+        vectorized.sort_buffer(run)
+        return run
+    return array(run.typecode, merge_sort(run, vectorize=False).values)
+
+
+def _merge_runs(
+    path: Path, runs: List[Path], typecode: str, memory_len: int
+) -> Path:
+    """Merge run files into a new one, then delete them."""
+    block = max(memory_len // (len(runs) + 1), 1)
+    merged = heapq.merge(*(read_values(_, typecode, block) for _ in runs))
+    with open(path, "wb") as f:
+        while chunk := array(typecode, islice(merged, block)):
+            chunk.tofile(f)
+    for run in runs:
+        run.unlink()
+    return path
@@ -3,17 +3,33 @@ Concrete use case of the DnC primitive:
 
 MergeSort - we receive two sub-arrays from the recursive step
 and perform the merge step using __add__.
+
+`merge_sort` is the bottom-up engine for when the whole input is at hand:
+it starts from the natural runs of the input instead of singletons, and
+merges pass after pass between two preallocated buffers, so no per-element
+wrapper or intermediate list gets allocated along the way. `sort_count`
+exposes the engine, which counts inversions as it goes, for `InvCount`.
+
+Numeric input takes the NumPy fast path of `algo.vectorized` when NumPy
+is around.
+
+`MergeSort.merge` merges any number of sorted operands in one go through
+a heap, for `divide_and_conquer(..., k=...)`.
 """
+import heapq
+from bisect import bisect_right
 from dataclasses import dataclass, replace
-from typing import Generic, List, Optional, TypeVar
+from typing import Generic, Iterable, List, Optional, Tuple, TypeVar
 
-from ..abstract.dnc import SupportsMerge
+from .. import vectorized
+from ..abstract.dnc import SupportsKMerge
 
 X = TypeVar("X")
+MIN_RUN = 32
 
 
 @dataclass(frozen=True)
-class MergeSort(SupportsMerge["MergeSort"], Generic[X]):
+class MergeSort(SupportsKMerge["MergeSort"], Generic[X]):
     values: List[X]
 
     @classmethod
@@ -41,3 +57,114 @@ class MergeSort(SupportsMerge["MergeSort"], Generic[X]):
         output.extend(self.values[i:])
         output.extend(other.values[j:])
         return replace(self, values=output)
+
+    def merge(self, *others: "MergeSort") -> "MergeSort":
+        """K-way merge; ties keep the order of the operands."""
+        if not others:
+            return self
+        _runs = (self.values, *(_.values for _ in others))
+        return replace(self, values=list(heapq.merge(*_runs)))
+
+
+def merge_sort(
+    xs: Iterable[X], min_run: int = MIN_RUN, vectorize: bool = True
+) -> "MergeSort[X]":
+    """Stable natural merge sort, same result as dnc over `MergeSort.pure`.
+
+    Runs shorter than `min_run` get extended with binary insertion sort,
+    which keeps the number of passes down on random input.
+    """
+    if vectorize and (a := vectorized.as_array(xs)) is not None:
+        return MergeSort(vectorized.merge_sort(a).tolist())
+
+    return MergeSort(sort_count(xs, min_run)[0])
+
+
+def sort_count(xs: Iterable[X], min_run: int = MIN_RUN) -> Tuple[List, int]:
+    """The `merge_sort` engine; return the sorted values and #inversions.
+
+    Every element moved past greater ones (reversing a descending run,
+    insertion sort shifts, merges taking from the right) is counted.
+    """
+    src: List = list(xs)
+    bounds, inv_count = _runs(src, min_run)
+    dst: List = [None] * len(src)
+
+    # merge adjacent runs from src into dst, then swap roles
+    while len(bounds) > 2:
+        _merged = [0]
+        for k in range(0, len(bounds) - 1, 2):
+            lo, mid = bounds[k], bounds[k + 1]
+            hi = bounds[k + 2] if k + 2 < len(bounds) else mid
+            inv_count += _merge(src, dst, lo, mid, hi)
+            _merged.append(hi)
+        src, dst, bounds = dst, src, _merged
+
+    return src, inv_count
+
+
+def _runs(xs: List, min_run: int) -> Tuple[List[int], int]:
+    """Sort xs into ascending runs in place; return the run boundaries.
+
+    Also return the inversions undone along the way.
+    """
+    bounds, lo, n, inv_count = [0], 0, len(xs), 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n and xs[hi] < xs[lo]:
+            # strictly descending => reversing it keeps the sort stable
+            while hi < n and xs[hi] < xs[hi - 1]:
+                hi += 1
+            xs[lo:hi] = xs[lo:hi][::-1]
+            inv_count += (hi - lo) * (hi - lo - 1) // 2
+        else:
+            while hi < n and xs[hi - 1] <= xs[hi]:
+                hi += 1
+
+        # too short => grow it with binary insertion sort
+        for i in range(hi, min(lo + min_run, n)):
+            x = xs[i]
+            at = bisect_right(xs, x, lo, i)
+            if at < i:
+                # shift within the run only, list.insert moves the whole tail
+                xs[at + 1 : i + 1] = xs[at:i]
+                xs[at] = x
+                inv_count += i - at
+            hi = i + 1
+
+        bounds.append(hi)
+        lo = hi
+    return bounds, inv_count
+
+
+def _merge(src: List, dst: List, lo: int, mid: int, hi: int) -> int:
+    """Merge the sorted src[lo:mid] and src[mid:hi] into dst[lo:hi].
+
+    Return the inversions crossed: every element taken from the right is
+    less than all of the left still to go.
+    """
+    if mid == hi or src[mid - 1] <= src[mid]:
+        # the odd run out, or two runs already in order
+        dst[lo:hi] = src[lo:hi]
+        return 0
+
+    i, j, k, inv_count = lo, mid, lo, 0
+    a, b = src[i], src[j]
+    while True:
+        if a <= b:
+            dst[k] = a
+            i += 1
+            k += 1
+            if i == mid:
+                dst[k:hi] = src[j:hi]
+                return inv_count
+            a = src[i]
+        else:
+            dst[k] = b
+            inv_count += mid - i
+            j += 1
+            k += 1
+            if j == hi:
+                dst[k:hi] = src[i:mid]
+                return inv_count
+            b = src[j]
@@ -2,25 +2,39 @@
 """
 QuickSort - we receive two sub-arrays from the recursive step,
 call partition on them and glue them together.
+
+Introsort flavoured: no recursion, insertion sort for small sub-arrays,
+and heapsort once the partitioning goes too deep, which caps the worst
+case at O(n log n) whatever the pivot strategy.
 """
 import abc
+from array import array
+from dataclasses import dataclass
 from pathlib import Path
 from random import randrange
-from typing import Any, List, Protocol, Type, TypeVar
+from typing import Any, List, Optional, Tuple, Type, TypeVar
 
+from algo import vectorized
+from algo.abstract.protocols import SupportsLessThan
 
-class SupportsLessThan(Protocol):
-    def __lt__(self, __other: Any) -> bool:
-        ...
+X = TypeVar("X", bound=SupportsLessThan)
 
+INSERTION_CUTOFF = 16
+NUMPY_CUTOFF = 4096
 
-X = TypeVar("X", bound=SupportsLessThan)
 
-total_comps = 0
+@dataclass
+class SortStats:
+    comparisons: int = 0  # element comparisons, pivot choice aside
+    partitions: int = 0
+    insertion_sorts: int = 0
+    heapsorts: int = 0
+    max_depth: int = 0
 
 
 class Strategy(metaclass=abc.ABCMeta):
     @staticmethod
+    @abc.abstractmethod
     def choose_pivot(start: int, end: int, xs: List[X]) -> int:
         """Return a pivot index given the array bounds and the array."""
 
@@ -28,11 +42,8 @@ class Strategy(metaclass=abc.ABCMeta):
 class MedianOfThree(Strategy):
     @staticmethod
     def choose_pivot(start: int, end: int, xs: List[X]) -> int:
-        i, k = start, end - 1
-        if (len_xs := len(xs)) % 2 == 1:  # odd array
-            j = len_xs // 2
-        else:  # even array
-            j = len_xs // 2 - 1
+        # middle of the sub-array, the left one for even lengths
+        i, j, k = start, start + (end - start - 1) // 2, end - 1
         mid_val = sorted([xs[i], xs[j], xs[k]])[1]
         if mid_val == xs[i]:
             return i
@@ -59,30 +70,193 @@ class Last(Strategy):
         return end - 1
 
 
-def quicksort(xs: List[X], strategy: Type[Strategy] = MedianOfThree) -> None:
-    return _quicksort(xs, 0, len(xs), strategy=strategy)
+Span = Tuple[int, int]
 
 
-def _quicksort(
-    xs: List[X], start: int, end: int, strategy: Type[Strategy]
-) -> None:
-    global total_comps  # pylint:disable=global-statement)
-    len_xs = len(xs[start:end])
+class Scheme(metaclass=abc.ABCMeta):
+    @staticmethod
+    @abc.abstractmethod
+    def partition(
+        xs: List[X], start: int, end: int, p_i: int, stats: SortStats
+    ) -> List[Span]:
+        """Partition xs[start:end] around xs[p_i] (and maybe another pivot).
+
+        Return the sub-arrays still left to sort.
+        """
+
+
+class Lomuto(Scheme):
+    @staticmethod
+    def partition(
+        xs: List[X], start: int, end: int, p_i: int, stats: SortStats
+    ) -> List[Span]:
+        _swap(xs, start, p_i)  # pivot is now first element
+
+        p_f = _partition(xs, start, end)
+        _swap(xs, p_f, start)
+        stats.comparisons += end - start - 1
+        return [(start, p_f), (p_f + 1, end)]
+
+
+class ThreeWay(Scheme):
+    @staticmethod
+    def partition(
+        xs: List[X], start: int, end: int, p_i: int, stats: SortStats
+    ) -> List[Span]:
+        pivot = xs[p_i]
+        _swap(xs, start, p_i)
+
+        # xs[start:lt] < pivot, xs[lt:i] == pivot, xs[gt:end] > pivot
+        lt, i, gt, comps = start, start + 1, end, 0
+        while i < gt:
+            x = xs[i]
+            comps += 1
+            if x < pivot:
+                xs[i], xs[lt] = xs[lt], x
+                lt += 1
+                i += 1
+                continue
+            comps += 1
+            if pivot < x:
+                gt -= 1
+                xs[i], xs[gt] = xs[gt], x
+            else:
+                i += 1
+
+        stats.comparisons += comps
+        return [(start, lt), (gt, end)]
+
+
+class DualPivot(Scheme):
+    """Yaroslavskiy's scheme, pivots xs[p_i] and the last element."""
+
+    @staticmethod
+    def partition(
+        xs: List[X], start: int, end: int, p_i: int, stats: SortStats
+    ) -> List[Span]:
+        hi = end - 1
+        if p_i == hi:
+            p_i = start
+        _swap(xs, start, p_i)
+        if xs[hi] < xs[start]:
+            _swap(xs, start, hi)
+        p, q = xs[start], xs[hi]
+
+        # xs[start+1:lt] < p, p <= xs[lt:i] <= q, xs[gt+1:hi] > q
+        lt, i, gt, comps = start + 1, start + 1, hi - 1, 1
+        while i <= gt:
+            x = xs[i]
+            comps += 1
+            if x < p:
+                xs[i], xs[lt] = xs[lt], x
+                lt += 1
+            else:
+                comps += 1
+                if not x < q:
+                    while i < gt and q < xs[gt]:
+                        comps += 1
+                        gt -= 1
+                    comps += i < gt
+                    xs[i], xs[gt] = xs[gt], x
+                    gt -= 1
+                    comps += 1
+                    if xs[i] < p:
+                        _swap(xs, i, lt)
+                        lt += 1
+            i += 1
 
-    if len_xs <= 1:
-        return
+        lt, gt = lt - 1, gt + 1
+        _swap(xs, start, lt)
+        _swap(xs, hi, gt)
+        stats.comparisons += comps
 
-    # pivot choosing
-    p_i = strategy.choose_pivot(start, end, xs)
-    _swap(xs, start, p_i)  # pivot is now first element
+        # equal pivots => the middle part is all equal keys
+        if not p < q:
+            return [(start, lt), (gt + 1, end)]
+        return [(start, lt), (lt + 1, gt), (gt + 1, end)]
 
-    p_f = _partition(xs, start, end)
-    _swap(xs, p_f, start)
 
-    _quicksort(xs, start, p_f, strategy=strategy)
-    total_comps = total_comps + (p_f - start)
-    _quicksort(xs, p_f + 1, end, strategy=strategy)
-    total_comps = total_comps + (end - (p_f + 1))
+def quicksort(  # pylint:disable=too-many-arguments
+    xs: List[X],
+    strategy: Type[Strategy] = MedianOfThree,
+    cutoff: int = INSERTION_CUTOFF,
+    max_depth: Optional[int] = None,
+    scheme: Type[Scheme] = Lomuto,
+    *,
+    vectorize: bool = False,
+) -> SortStats:
+    """In-place introsort; return what it took.
+
+    Partitions get processed off an explicit stack, smaller side first,
+    so the stack never holds more than log2(n) of them. Sub-arrays of at
+    most `cutoff` elements get insertion sorted, and sub-arrays more than
+    `max_depth` (2 log2(n) by default) partitions deep get heapsorted.
+    `cutoff=1, max_depth=len(xs)` is plain quicksort.
+
+    `strategy` picks the pivot, `scheme` partitions around it.
+
+    With `vectorize`, numeric input takes the NumPy path instead: always
+    three-way partitions, `ndarray.sort` for small sub-arrays whatever
+    the cutoff, and only depth and heapsorts get reported.
+    """
+    stats = SortStats()
+    if max_depth is None:
+        max_depth = 2 * (max(len(xs), 1).bit_length() - 1)
+
+    if vectorize and (a := vectorized.as_array(xs)) is not None:
+        _quicksort_np(a, strategy, max_depth, stats)
+        if isinstance(xs, array):
+            xs[:] = array(xs.typecode, a.tolist())
+        elif a is not xs:
+            xs[:] = a.tolist()
+        return stats
+
+    stack = [(0, len(xs), 0)]
+    while stack:
+        start, end, depth = stack.pop()
+        stats.max_depth = max(stats.max_depth, depth)
+        if end - start <= 1:
+            continue
+        if end - start <= cutoff:
+            _insertion_sort(xs, start, end, stats)
+            continue
+        if depth >= max_depth:
+            _heapsort(xs, start, end, stats)
+            continue
+
+        # pivot choosing
+        p_i = strategy.choose_pivot(start, end, xs)
+        spans = scheme.partition(xs, start, end, p_i, stats)
+        stats.partitions += 1
+
+        # larger sides go first on the stack => smallest gets popped first
+        spans.sort(key=lambda _: _[0] - _[1])
+        stack.extend((lo, hi, depth + 1) for lo, hi in spans)
+    return stats
+
+
+def _quicksort_np(
+    a: Any, strategy: Type[Strategy], max_depth: int, stats: SortStats
+) -> None:
+    """Same loop as `quicksort`, on a NumPy array, three-way partitions."""
+    stack = [(0, len(a), 0)]
+    while stack:
+        start, end, depth = stack.pop()
+        stats.max_depth = max(stats.max_depth, depth)
+        if end - start <= NUMPY_CUTOFF:
+            a[start:end].sort()
+            continue
+        if depth >= max_depth:
+            a[start:end].sort(kind="heapsort")
+            stats.heapsorts += 1
+            continue
+
+        pivot = a[strategy.choose_pivot(start, end, a)]
+        n_lt, n_gt = vectorized.partition3(a[start:end], pivot)
+
+        spans = [(start, start + n_lt), (end - n_gt, end)]
+        spans.sort(key=lambda _: _[0] - _[1])
+        stack.extend((lo, hi, depth + 1) for lo, hi in spans)
 
 
 def _swap(xs: List[X], a: int, b: int) -> None:
@@ -100,6 +274,48 @@ def _partition(xs: List[X], start: int, end: int) -> int:
     return i - 1
 
 
+def _insertion_sort(
+    xs: List[X], start: int, end: int, stats: SortStats
+) -> None:
+    stats.insertion_sorts += 1
+    for i in range(start + 1, end):
+        x, j = xs[i], i
+        while j > start:
+            stats.comparisons += 1
+            if not x < xs[j - 1]:
+                break
+            xs[j] = xs[j - 1]
+            j -= 1
+        xs[j] = x
+
+
+def _heapsort(xs: List[X], start: int, end: int, stats: SortStats) -> None:
+    """In-place heapsort of xs[start:end], with a max-heap."""
+    stats.heapsorts += 1
+    for i in reversed(range((end - start) // 2)):
+        _sift_down(xs, start, i, end - start, stats)
+    for n in reversed(range(1, end - start)):
+        _swap(xs, start, start + n)
+        _sift_down(xs, start, 0, n, stats)
+
+
+def _sift_down(
+    xs: List[X], base: int, i: int, n: int, stats: SortStats
+) -> None:
+    x = xs[base + i]
+    while (child := 2 * i + 1) < n:
+        if child + 1 < n:
+            stats.comparisons += 1
+            if xs[base + child] < xs[base + child + 1]:
+                child += 1
+        stats.comparisons += 1
+        if not x < xs[base + child]:
+            break
+        xs[base + i] = xs[base + child]
+        i = child
+    xs[base + i] = x
+
+
 if __name__ == "__main__":
     ints = [
         int(_)
@@ -107,5 +323,11 @@ if __name__ == "__main__":
         .read_text()
         .splitlines()
     ]
-    quicksort(ints, strategy=MedianOfThree)
-    print(f"{total_comps=}")
+    _stats = quicksort(
+        ints,
+        strategy=MedianOfThree,
+        cutoff=1,
+        max_depth=len(ints),
+        vectorize=False,
+    )
+    print(f"{_stats.comparisons=}")
@@ -0,0 +1,81 @@
+"""Unit tests covering the external merge sort."""
+import random
+import tracemalloc
+from pathlib import Path
+from time import time
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats, integers, lists
+
+from .. import vectorized
+from .external_sort import external_sort, read_values, write_values
+
+_INT64 = integers(-(1 << 63), (1 << 63) - 1)
+
+
+@given(lists(_INT64), integers(8, 256))
+def test_external_sort(xs: list, memory: int) -> None:
+    assert list(external_sort(xs, memory=memory)) == sorted(xs)
+
+
+@given(lists(floats(allow_nan=False)))
+def test_external_sort_floats(xs: list) -> None:
+    assert list(external_sort(xs, memory=64, typecode="d")) == sorted(xs)
+
+
+def test_multi_pass(tmp_path: Path) -> None:
+    # 8 values per run and a fan-in of 2 => several intermediate passes
+    xs = random.choices(range(1000), k=1000)
+    _sorted = external_sort(xs, memory=64, tmp_dir=tmp_path)
+    assert list(_sorted) == sorted(xs)
+    assert not list(tmp_path.iterdir())
+
+    # closing early cleans up too
+    _sorted = external_sort(xs, memory=64, tmp_dir=tmp_path)
+    assert next(_sorted) == min(xs)
+    _sorted.close()
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("has_numpy", [False, True])
+def test_memory_budget(has_numpy: bool) -> None:
+    xs = [random.getrandbits(63) for _ in range(1 << 17)]
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(vectorized, "HAS_NUMPY", has_numpy and vectorized.HAS_NUMPY)
+        tracemalloc.start()
+        try:
+            for _ in external_sort(iter(xs), memory=1 << 19):
+                pass
+            _peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    assert _peak < 1.5 * (1 << 19)
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    xs = random.choices(range(-(1 << 40), 1 << 40), k=10000)
+    path = write_values(tmp_path / "xs.bin", xs)
+    assert path.stat().st_size == 8 * len(xs)
+    assert list(read_values(path, block=7)) == xs
+
+
+@pytest.mark.bench
+def test_speedup(tmp_path: Path) -> None:
+    # scale _size up for multi-GB inputs, 8 bytes per value
+    _size, _memory = 1 << 22, 16 << 20
+    path = write_values(
+        tmp_path / "xs.bin",
+        (random.getrandbits(63) for _ in range(_size)),
+    )
+
+    start_time = time()
+    sorted(read_values(path))
+    print(f"In-memory sorted time: {time() - start_time}")
+
+    start_time = time()
+    _sorted = external_sort(read_values(path), memory=_memory)
+    write_values(tmp_path / "sorted.bin", _sorted)
+    print(
+        f"External sort time, {_memory >> 20}MiB budget: {time() - start_time}"
+    )
@@ -1,16 +1,18 @@
 """Unit tests covering dnc + MergeSort."""
 import random
+from functools import total_ordering
 from multiprocessing import Pool as ProcPool
 from multiprocessing.dummy import Pool
 from time import time
-from typing import List
+from typing import Any, List, NamedTuple
 
 import pytest
 from hypothesis import given
 from hypothesis.strategies import floats, integers, lists, one_of, text
+from more_itertools import chunked
 
-from ..abstract.dnc import divide_and_conquer
-from .merge_sort import MergeSort
+from ..abstract.dnc import divide_and_conquer, parallel_divide_and_conquer
+from .merge_sort import MergeSort, merge_sort
 
 
 @given(
@@ -42,6 +44,26 @@ def test_parallel_merge_sort(input_arr: list) -> None:
             assert _sorted[0].values == sorted(input_arr[:])
 
 
+@given(
+    one_of(
+        lists(integers(), max_size=1024),
+        lists(floats(allow_nan=False)),
+        lists(text()),
+    ),
+    integers(2, 16),
+)
+def test_k_way_merge_sort(input_arr: list, k: int) -> None:
+    s_lists = [MergeSort.pure(_) for _ in input_arr]
+    _sorted = divide_and_conquer(s_lists, k=k)
+    if _sorted:
+        assert _sorted[0].values == sorted(input_arr[:])
+
+    # ties keep the order of the operands
+    runs = [[_Keyed(0, r), _Keyed(1, r)] for r in range(k)]
+    _merged = MergeSort(runs[0]).merge(*map(MergeSort, runs[1:])).values
+    assert [_.tag for _ in _merged][:k] == list(range(k))
+
+
 @given(lists(integers()))
 def test_sortlist(input_arr: List[int]) -> None:
     _pivot = len(input_arr) // 2
@@ -52,6 +74,65 @@ def test_sortlist(input_arr: List[int]) -> None:
     assert (left + right).values == sorted([*a, *b])
 
 
+@total_ordering
+class _Keyed(NamedTuple):
+    key: int
+    tag: int
+
+    def __eq__(self, other: Any) -> bool:
+        return bool(self.key == other.key)
+
+    def __lt__(self, other: Any) -> bool:
+        return bool(self.key < other.key)
+
+
+@given(
+    one_of(
+        lists(integers(), max_size=1024),
+        lists(floats(allow_nan=False)),
+        lists(text()),
+    ),
+    integers(1, 64),
+)
+def test_bottom_up(input_arr: list, min_run: int) -> None:
+    _sorted = divide_and_conquer([MergeSort.pure(_) for _ in input_arr])
+    assert merge_sort(input_arr, min_run=min_run) == (
+        _sorted[0] if _sorted else MergeSort([])
+    )
+
+    # descending runs and organ pipes are natural runs too
+    assert merge_sort(input_arr[::-1]).values == sorted(input_arr)
+    _pipe = sorted(input_arr) + sorted(input_arr, reverse=True)
+    assert merge_sort(_pipe, min_run=min_run).values == sorted(_pipe)
+
+
+@given(lists(integers(0, 4)), integers(1, 64))
+def test_bottom_up_stable(keys: List[int], min_run: int) -> None:
+    xs = [_Keyed(k, i) for i, k in enumerate(keys)]
+    _sorted = merge_sort(xs, min_run=min_run).values
+    assert [(_.key, _.tag) for _ in _sorted] == sorted(
+        zip(keys, range(len(xs)))
+    )
+
+
+@pytest.mark.parametrize(
+    "input_arr",
+    [
+        [],
+        [42],
+        [random.getrandbits(70) - (1 << 69) for _ in range(1000)],
+        random.choices(range(1 << 40), k=1000),
+        [random.random() for _ in range(1000)],
+        [str(_) for _ in random.choices(range(100), k=1000)],
+    ],
+)
+def test_shm_merge_sort(input_arr: list) -> None:
+    _sorted = parallel_divide_and_conquer(input_arr, merge_sort, chunks=3)
+    assert [_.values for _ in _sorted] == (
+        [sorted(input_arr)] if input_arr else []
+    )
+
+
 @pytest.mark.bench
 def test_speedup() -> None:
     _size = 200
@@ -66,3 +147,51 @@ def test_speedup() -> None:
     with ProcPool(12) as pool:
         divide_and_conquer(input_s, starmap=pool.starmap)
     print(f"Pool dnc starmap time: {time() - start_time}")
+
+
+@pytest.mark.bench
+def test_k_way_speedup() -> None:
+    _size = 200000
+    input_arr = random.sample(range(1, 100000000), _size)
+    runs = [MergeSort(sorted(_)) for _ in chunked(input_arr, 1000)]
+
+    for k in (2, 4, 16):
+        start_time = time()
+        divide_and_conquer(runs, k=k)
+        print(f"{k}-way dnc time over {len(runs)} runs: {time() - start_time}")
+
+
+@pytest.mark.bench
+def test_shm_speedup() -> None:
+    _size = 2000000
+    input_arr = random.choices(range(1, 100000000), k=_size)
+
+    start_time = time()
+    merge_sort(input_arr)
+    print(f"Serial bottom-up merge sort time: {time() - start_time}")
+
+    start_time = time()
+    parallel_divide_and_conquer(input_arr, merge_sort)
+    print(f"Shared memory dnc time: {time() - start_time}")
+
+
+@pytest.mark.bench
+def test_bottom_up_speedup() -> None:
+    _size = 200000
+    input_arr = random.sample(range(1, 100000000), _size)
+
+    start_time = time()
+    divide_and_conquer([MergeSort.pure(_) for _ in input_arr])
+    print(f"Normal dnc time: {time() - start_time}")
+
+    for _name, _arr in [
+        ("random", input_arr),
+        ("sorted runs", [*sorted(input_arr[::2]), *sorted(input_arr[1::2])]),
+    ]:
+        start_time = time()
+        merge_sort(_arr)
+        print(f"Bottom-up merge sort time ({_name}): {time() - start_time}")
+
+        start_time = time()
+        sorted(_arr)
+        print(f"Builtin sorted time ({_name}): {time() - start_time}")
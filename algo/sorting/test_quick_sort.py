@@ -1,10 +1,45 @@
 """Unit tests covering QuickSort"""
+import random
 from copy import deepcopy
+from time import time
+from typing import Callable, Dict, List, Type
 
+import pytest
 from hypothesis import given
-from hypothesis.strategies import floats, integers, lists, one_of, text
+from hypothesis.strategies import (
+    floats,
+    integers,
+    lists,
+    one_of,
+    sampled_from,
+    text,
+)
+
+from .quick_sort import (
+    DualPivot,
+    First,
+    Last,
+    Lomuto,
+    MedianOfThree,
+    Random,
+    Scheme,
+    SortStats,
+    Strategy,
+    ThreeWay,
+    _heapsort,
+    quicksort,
+)
+
+_STRATEGIES = sampled_from([MedianOfThree, Random, First, Last])
+_SCHEMES = sampled_from([Lomuto, ThreeWay, DualPivot])
 
-from .quick_sort import quicksort
+_DISTRIBUTIONS: Dict[str, Callable[[int], List[int]]] = {
+    "random": lambda n: random.sample(range(n), n),
+    "sorted": lambda n: list(range(n)),
+    "reversed": lambda n: list(range(n, 0, -1)),
+    "few-unique": lambda n: random.choices(range(8), k=n),
+    "organ-pipe": lambda n: [*range(n // 2), *range(n - n // 2, 0, -1)],
+}
 
 
 @given(
@@ -18,3 +53,106 @@ def test_quick_sort(input_arr: list) -> None:
     _copy = deepcopy(input_arr)
     quicksort(_copy)
     assert _copy == sorted(input_arr)
+
+
+@given(
+    lists(integers(-16, 16), max_size=512),
+    _STRATEGIES,
+    integers(1, 32),
+    integers(0, 12),
+)
+def test_introsort(
+    input_arr: list, strategy: Type[Strategy], cutoff: int, max_depth: int
+) -> None:
+    _copy = input_arr[:]
+    stats = quicksort(_copy, strategy, cutoff=cutoff, max_depth=max_depth)
+    assert _copy == sorted(input_arr)
+    assert stats.max_depth <= max_depth
+
+
+@given(
+    one_of(
+        lists(integers(-8, 8), max_size=512), lists(floats(allow_nan=False))
+    ),
+    _STRATEGIES,
+    _SCHEMES,
+    integers(1, 32),
+)
+def test_schemes(
+    input_arr: list,
+    strategy: Type[Strategy],
+    scheme: Type[Scheme],
+    cutoff: int,
+) -> None:
+    _copy = input_arr[:]
+    quicksort(_copy, strategy, cutoff=cutoff, scheme=scheme)
+    assert _copy == sorted(input_arr)
+
+    # no fallback needed to sort them either
+    _copy = input_arr[:]
+    stats = quicksort(_copy, strategy, 1, len(_copy), scheme)
+    assert _copy == sorted(input_arr) and stats.heapsorts == 0
+
+
+def test_few_unique() -> None:
+    # every three-way partition sets one key aside for good
+    xs = random.choices(range(8), k=20000)
+    stats = quicksort(
+        xs,
+        Random,
+        cutoff=1,
+        max_depth=len(xs),
+        scheme=ThreeWay,
+    )
+    assert xs == sorted(xs)
+    assert stats.partitions <= 8 and stats.comparisons <= 2 * 8 * 20000
+
+
+@given(lists(integers()))
+def test_heapsort(input_arr: list) -> None:
+    _copy = [42, *input_arr, -42]
+    _heapsort(_copy, 1, len(_copy) - 1, SortStats())
+    assert _copy == [42, *sorted(input_arr), -42]
+
+
+@pytest.mark.parametrize("strategy", [First, Last])
+def test_worst_case(strategy: Type[Strategy]) -> None:
+    # sorted input used to blow the recursion limit for these two
+    xs = list(range(20000))
+    stats = quicksort(xs, strategy)
+    assert xs == list(range(20000))
+    assert stats.heapsorts > 0
+    assert stats.comparisons < 4 * 20000 * 15  # vs. 2e8 without fallback
+
+    # plain quicksort is quadratic, but no longer recursive
+    xs = list(range(3000, 0, -1))
+    stats = quicksort(xs, strategy, cutoff=1, max_depth=len(xs))
+    assert xs == list(range(1, 3001))
+    assert stats.comparisons == 3000 * 2999 // 2
+
+
+def test_comparisons() -> None:
+    # the textbook count: m - 1 comparisons per partition of m elements
+    xs = [3, 8, 2, 5, 1, 4, 7, 6]
+    stats = quicksort(xs, First, cutoff=1, max_depth=len(xs))
+    assert xs == sorted(xs)
+    assert stats.comparisons == 15 and stats.heapsorts == 0
+
+    xs = random.sample(range(10000), 10000)
+    stats = quicksort(xs)
+    assert stats.insertion_sorts > 0 and stats.heapsorts == 0
+
+
+@pytest.mark.bench
+def test_schemes_speedup() -> None:
+    _size = 100000
+    for name, distribution in _DISTRIBUTIONS.items():
+        input_arr = distribution(_size)
+        for scheme in (Lomuto, ThreeWay, DualPivot):
+            _copy = input_arr[:]
+            start_time = time()
+            stats = quicksort(_copy, scheme=scheme)
+            print(
+                f"{name} {scheme.__name__} time: {time() - start_time}, "
+                f"{stats.comparisons} comparisons, {stats.heapsorts} heapsorts"
+            )
@@ -1,9 +1,22 @@
 """Unit tests covering InvCount."""
+import os
+import random
+from functools import partial
+from itertools import accumulate
+from multiprocessing import Pool as ProcPool
+from time import time
+
+import pytest
 from hypothesis import given
 from hypothesis.strategies import integers, lists
 
-from .abstract.dnc import divide_and_conquer
-from .inv_count import InvCount
+from .abstract.dnc import (
+    divide_and_conquer,
+    dnc_leaf,
+    parallel_divide_and_conquer,
+)
+from .inv_count import Fenwick, InvCount, StreamInvCount, inv_per_element
+from .sorting.merge_sort import sort_count
 
 
 def _brute(arr: list) -> int:
@@ -30,3 +43,131 @@ def test_against_derpy_implementation(xs: list) -> None:
     ys = [InvCount.pure(_) for _ in xs]
     _counted = divide_and_conquer(ys)[0].inv_count
     assert _counted == _brute(xs)
+
+
+@given(lists(integers(-8, 8), min_size=1), integers(2, 9))
+def test_k_way(xs: list, k: int) -> None:
+    ys = [InvCount.pure(_) for _ in xs]
+    _counted = divide_and_conquer(ys, k=k)
+    assert len(_counted) == 1
+    assert _counted[0].inv_count == _brute(xs)
+    assert _counted[0].values == sorted(xs)
+
+
+@given(lists(integers(-8, 8)), integers(1, 40))
+def test_from_values(xs: list, min_run: int) -> None:
+    _counted = divide_and_conquer([InvCount.pure(_) for _ in xs])
+    _expected = _counted[0] if xs else InvCount([])
+    assert InvCount.from_values(xs, vectorize=False) == _expected
+    assert InvCount(*sort_count(xs, min_run=min_run)) == _expected
+
+    # descending runs get reversed in one go
+    _descending = [*range(50, 0, -1), *xs, *range(30, 0, -1)]
+    assert sort_count(_descending, min_run)[1] == _brute(_descending)
+
+
+@pytest.mark.parametrize(
+    "xs",
+    [
+        [],
+        [1],
+        random.choices(range(100), k=3000),
+        random.choices(range(1 << 40), k=3000),
+        [random.random() for _ in range(3000)],
+        [str(_) for _ in random.choices(range(100), k=3000)],
+    ],
+)
+def test_parallel(xs: list) -> None:
+    _counted = divide_and_conquer([InvCount.pure(_) for _ in xs])
+    _expected = _counted[0] if xs else InvCount([])
+    assert InvCount.parallel(xs, chunks=3) == _expected
+    assert InvCount.parallel(xs, chunks=3, vectorize=False) == _expected
+
+
+def test_shm_inv_count() -> None:
+    xs = random.choices(range(100), k=2000)
+    _leaf = partial(dnc_leaf, InvCount.pure)
+    _counted = parallel_divide_and_conquer(xs, _leaf, chunks=4)
+    assert len(_counted) == 1
+    assert _counted[0].inv_count == _brute(xs)
+    assert _counted[0].values == sorted(xs)
+
+
+@given(lists(integers(0, 100)))
+def test_fenwick(counts: list) -> None:
+    fenwick, built = Fenwick(len(counts)), Fenwick.from_counts(counts)
+    for i, c in enumerate(counts):
+        fenwick.add(i, c)
+    assert fenwick.tree == built.tree
+    assert [built.prefix(i) for i in range(len(counts) + 1)] == [
+        0,
+        *accumulate(counts),
+    ]
+
+
+@given(lists(integers(-8, 8)), integers(1, 10))
+def test_stream(xs: list, window: int) -> None:
+    stream = StreamInvCount(range(-8, 9))
+    windowed = StreamInvCount(range(-8, 9), window=window)
+    for i, x in enumerate(xs):
+        stream.append(x)
+        windowed.append(x)
+        assert stream.inv_count == _brute(xs[: i + 1])
+        assert windowed.inv_count == _brute(xs[max(i + 1 - window, 0) : i + 1])
+
+    while windowed:
+        windowed.popleft()
+        assert windowed.inv_count == _brute(list(windowed.values))
+
+    with pytest.raises(ValueError):
+        stream.append(9)
+
+
+@given(lists(integers(-8, 8)))
+def test_inv_per_element(xs: list) -> None:
+    involved = inv_per_element(xs)
+    assert involved == [
+        sum(xs[j] > xs[i] for j in range(i))
+        + sum(xs[j] < xs[i] for j in range(i + 1, len(xs)))
+        for i in range(len(xs))
+    ]
+    assert sum(involved) == 2 * _brute(xs)
+
+
+@pytest.mark.bench
+def test_window_speedup() -> None:
+    _size, _window = 200, 5000
+    xs = random.choices(range(1000), k=_window + _size)
+
+    start_time = time()
+    for i in range(_size):
+        InvCount.from_values(xs[i : i + _window], vectorize=False)
+    print(f"Recount per update time: {time() - start_time}")
+
+    start_time = time()
+    stream = StreamInvCount(range(1000), window=_window)
+    stream.extend(xs[:_window])
+    for x in xs[_window:]:
+        stream.append(x)
+    print(f"Sliding window time: {time() - start_time}")
+
+
+@pytest.mark.bench
+def test_parallel_speedup() -> None:
+    _size = 1000000
+    xs = random.choices(range(1, 100000000), k=_size)
+
+    with ProcPool() as pool:
+        start_time = time()
+        serial = InvCount.from_values(xs)
+        serial_time = time() - start_time
+        print(f"Serial count time: {serial_time}")
+
+        start_time = time()
+        assert InvCount.parallel(xs, map_=pool.map) == serial
+        pool_time = time() - start_time
+        print(f"Pool count time: {pool_time}")
+
+    # one core only adds the process overhead to the serial work
+    if (os.cpu_count() or 1) > 1:
+        assert pool_time < serial_time
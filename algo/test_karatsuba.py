@@ -1,10 +1,55 @@
 """Unit tests covering Karatsuba multiplication."""
+import operator
+import random
+from functools import partial
+from timeit import timeit
+
+import pytest
 from hypothesis import given
 from hypothesis.strategies import integers
 
-from .karatsuba import karatsuba_mul
+from .karatsuba import karatsuba_mul, karatsuba_mul_bits
 
 
 @given(integers(min_value=1), integers(min_value=1))
 def test_karatsuba(x: int, y: int) -> None:
     assert x * y == karatsuba_mul(x, y)
+
+
+_big = integers(min_value=-(1 << 3000), max_value=1 << 3000)
+
+
+@given(_big, _big)
+def test_karatsuba_bits(x: int, y: int) -> None:
+    assert x * y == karatsuba_mul_bits(x, y, threshold=16)
+
+
+@given(_big, _big)
+def test_toom3(x: int, y: int) -> None:
+    assert x * y == karatsuba_mul_bits(x, y, threshold=16, toom3_threshold=512)
+
+
+@pytest.mark.bench
+def test_crossover() -> None:
+    for bits in (1 << 8, 1 << 11, 1 << 14, 1 << 17):
+        x, y = random.getrandbits(bits), random.getrandbits(bits)
+        _number = max((1 << 14) // bits, 1)
+        for name, run in [
+            ("builtin", partial(operator.mul, x, y)),
+            ("decimal strings", partial(karatsuba_mul, x, y)),
+            ("bits", partial(karatsuba_mul_bits, x, y, threshold=512)),
+            ("bits, native base", partial(karatsuba_mul_bits, x, y)),
+            (
+                "bits, toom3",
+                partial(
+                    karatsuba_mul_bits,
+                    x,
+                    y,
+                    threshold=512,
+                    toom3_threshold=4096,
+                ),
+            ),
+        ]:
+            if name == "decimal strings" and bits > 1 << 8:
+                continue
+            print(f"{bits=} {name} time: {timeit(run, number=_number)}")
@@ -0,0 +1,104 @@
+"""Unit tests covering Kendall's tau."""
+import math
+import random
+from itertools import combinations
+from time import time
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, tuples
+
+from .abstract.dnc import divide_and_conquer
+from .inv_count import InvCount
+from .kendall_tau import KendallTau, kendall_tau, kendall_tau_distance
+
+
+def _brute(xs: list, ys: list) -> float:
+    concordant = discordant = x_untied = y_untied = 0
+    for i, j in combinations(range(len(xs)), 2):
+        dx, dy = xs[i] - xs[j], ys[i] - ys[j]
+        concordant += dx * dy > 0
+        discordant += dx * dy < 0
+        x_untied += dx != 0
+        y_untied += dy != 0
+    if not x_untied or not y_untied:
+        return math.nan
+    return (concordant - discordant) / math.sqrt(x_untied * y_untied)
+
+
+@given(lists(tuples(integers(0, 5), integers(0, 5))))
+def test_tau_b(pairs: list) -> None:
+    xs, ys = [_[0] for _ in pairs], [_[1] for _ in pairs]
+    expected = _brute(xs, ys)
+    tau = kendall_tau(xs, ys)
+    assert (math.isnan(tau) and math.isnan(expected)) or math.isclose(
+        tau, expected, abs_tol=1e-12
+    )
+
+    assert kendall_tau_distance(xs, ys) == sum(
+        (xs[i] - xs[j]) * (ys[i] - ys[j]) < 0
+        for i, j in combinations(range(len(xs)), 2)
+    )
+
+
+def test_textbook_case() -> None:
+    assert kendall_tau([1, 2, 3, 4, 5], [1, 2, 3, 4, 5]) == 1.0
+    assert kendall_tau([1, 2, 3, 4, 5], [5, 4, 3, 2, 1]) == -1.0
+    assert kendall_tau([1, 2, 3], [3, 1, 2]) == pytest.approx(-1 / 3)
+    assert math.isnan(kendall_tau([1, 1, 1], [1, 2, 3]))
+
+    with pytest.raises(ValueError):
+        kendall_tau([1, 2], [1, 2, 3])
+
+
+def test_orderings() -> None:
+    ref = KendallTau.from_ordering("abcde")
+    orderings = ["abcde", "edcba", "bacde", "abced"]
+    assert ref.distances(map(ref.positions, orderings)) == [0, 10, 1, 1]
+    assert ref.taus(map(ref.positions, orderings))[:2] == [1.0, -1.0]
+
+    with pytest.raises(ValueError):
+        ref.positions("abcdf")
+    with pytest.raises(ValueError):
+        ref.positions("abcd")
+    with pytest.raises(ValueError, match="twice"):
+        ref.positions("abcdea")
+    with pytest.raises(ValueError, match="twice"):
+        ref.positions("abcda")
+    with pytest.raises(ValueError, match="repeats"):
+        KendallTau.from_ordering("abca")
+
+    class Sub(KendallTau):
+        pass
+
+    assert isinstance(Sub.from_ordering("ab"), Sub)
+
+
+@given(
+    lists(integers(0, 9), min_size=2, max_size=50),
+    lists(lists(integers(0, 9), min_size=50, max_size=50), max_size=5),
+)
+def test_batch(reference: list, yss: list) -> None:
+    yss = [ys[: len(reference)] for ys in yss]
+    ref = KendallTau(reference)
+    assert ref.distances(yss) == [
+        kendall_tau_distance(reference, ys) for ys in yss
+    ]
+
+
+@pytest.mark.bench
+def test_speedup() -> None:
+    _size, _rankings = 10000, 50
+    reference = random.sample(range(_size), _size)
+    rankings = [random.sample(range(_size), _size) for _ in range(_rankings)]
+
+    start_time = time()
+    _index = {item: i for i, item in enumerate(reference)}
+    for ranking in rankings:
+        divide_and_conquer([InvCount.pure(_index[_]) for _ in ranking])
+    print(f"Mapping + dnc over InvCount.pure time: {time() - start_time}")
+
+    start_time = time()
+    ref = KendallTau.from_ordering(reference)
+    ref.distances(map(ref.positions, rankings))
+    print(f"KendallTau batch time: {time() - start_time}")
@@ -0,0 +1,100 @@
+"""Unit tests covering the NumPy fast paths."""
+import random
+from array import array
+from time import time
+from typing import Any, Iterator
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats, integers, lists, one_of
+
+from . import vectorized
+from .abstract.dnc import divide_and_conquer
+from .inv_count import InvCount
+from .sorting.merge_sort import merge_sort
+from .sorting.quick_sort import First, quicksort
+
+np = pytest.importorskip("numpy")
+
+_NUMBERS = one_of(
+    lists(integers(-(1 << 63), (1 << 63) - 1)),
+    lists(integers(-4, 4)),
+    lists(floats(allow_nan=False)),
+)
+
+
+@pytest.fixture(autouse=True)
+def _always() -> Iterator[None]:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(vectorized, "NUMPY_THRESHOLD", 0)
+        yield
+
+
+@given(_NUMBERS)
+def test_same_results(xs: list) -> None:
+    assert vectorized.as_array(xs) is not None or not xs
+
+    _pure = xs[:]
+    quicksort(_pure)
+    _fast = xs[:]
+    quicksort(_fast, First, vectorize=True)
+    assert _fast == _pure
+    assert [type(_) for _ in _fast] == [type(_) for _ in _pure]
+
+    assert merge_sort(xs) == merge_sort(xs, vectorize=False)
+    _counted = divide_and_conquer([InvCount.pure(_) for _ in xs])
+    assert InvCount.from_values(xs) == (_counted[0] if xs else InvCount([]))
+
+
+@given(_NUMBERS, integers(1, 8))
+def test_merge_sort(xs: list, block: int) -> None:
+    a = np.array(xs, dtype=vectorized.as_array(xs).dtype if xs else None)
+    assert vectorized.merge_sort(a, block=block).tolist() == sorted(xs)
+
+
+@given(_NUMBERS, lists(integers(0, 8), max_size=4))
+def test_inv_count_merge(xs: list, cuts: list) -> None:
+    _cuts = [0, *sorted(min(cut, len(xs)) for cut in cuts), len(xs)]
+    runs = [InvCount.from_values(xs[i:j]) for i, j in zip(_cuts, _cuts[1:])]
+    _fast = runs[0].merge(*runs[1:])
+    assert _fast == runs[0].merge(*runs[1:], vectorize=False)
+    assert _fast.values == sorted(xs)
+    assert _fast == InvCount.from_values(xs, vectorize=False)
+
+
+def test_fallbacks() -> None:
+    assert vectorized.as_array(["a", "b"]) is None
+    assert vectorized.as_array([1, 2.0]) is None
+    assert vectorized.as_array([1, 1 << 64]) is None
+    assert vectorized.as_array([1.0, float("nan")]) is None
+    assert vectorized.as_array(x for x in [1, 2]) is None
+    assert vectorized.as_array([1, 2], threshold=3) is None
+    assert vectorized.as_arrays([[1, 2], [1.0]]) is None
+    assert vectorized.as_arrays([[1], [2]], threshold=3) is None
+
+    # mixed chunks go through the heap merge
+    mixed = InvCount.from_values([2, 1]).merge(InvCount.from_values([1.5]))
+    assert mixed.values == [1, 1.5, 2] and mixed.inv_count == 2
+
+    # in place on arrays
+    a = np.array([3, 1, 2])
+    quicksort(a, vectorize=True)
+    assert a.tolist() == [1, 2, 3]
+    b: Any = array("q", [3, 1, 2])
+    quicksort(b, vectorize=True)
+    assert b == array("q", [1, 2, 3])
+
+
+@pytest.mark.bench
+def test_speedup() -> None:
+    _size = 1000000
+    input_arr = random.choices(range(-(1 << 40), 1 << 40), k=_size)
+    for name, run in [
+        ("quicksort", lambda v: quicksort(input_arr[:], vectorize=v)),
+        ("merge sort", lambda v: merge_sort(input_arr, vectorize=v)),
+        ("inv count", lambda v: InvCount.from_values(input_arr, vectorize=v)),
+    ]:
+        for vectorize in (False, True):
+            start_time = time()
+            run(vectorize)
+            print(f"{name} {vectorize=} time: {time() - start_time}")
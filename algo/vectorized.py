@@ -0,0 +1,173 @@
+"""
+Optional NumPy fast paths for homogeneous numeric input.
+
+NumPy isn't a dependency, it gets used if installed; without it, or for
+anything but ints fitting 64 bits and non-NaN floats, callers stick to
+their pure Python paths. Results match the pure paths exactly: sorts are
+stable and values convert back to the very same Python ints and floats.
+
+- `partition3`: vectorized three-way partitioning, for quicksort;
+- `merge_sort`: stable block sorts, then bottom-up `np.searchsorted`
+  merges (`merge`);
+- `sort_buffer`: in place sort of an `array.array`, through a view;
+- `merge_count`: merges sorted runs in order, counting the inversions
+  across them with `np.searchsorted` (for `InvCount.merge`);
+- `inv_count`: bottom-up merge levels over dense ranks, counting for
+  every element of a right run how many of its left run are greater, all
+  pairs of a level at once.
+"""
+from array import array
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from .abstract.dnc import typecode_of
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+
+NUMPY_THRESHOLD = 1024  # below that, conversions cost more than they save
+BLOCK = 1 << 14
+
+
+def as_array(xs: Iterable, threshold: Optional[int] = None) -> Any:
+    """Return xs as an int64 / float64 array, or None if it won't do.
+
+    Arrays get returned as they are, lists, tuples and `array.array`s of
+    at least `threshold` (`NUMPY_THRESHOLD`) numbers get converted, and
+    anything else is None.
+    """
+    if not HAS_NUMPY:
+        return None
+    if threshold is None:
+        threshold = NUMPY_THRESHOLD
+    if isinstance(xs, np.ndarray):
+        if xs.ndim != 1 or xs.dtype.kind not in "if" or len(xs) < threshold:
+            return None
+        a = xs
+    elif (
+        isinstance(xs, (list, tuple, array))
+        and len(xs) >= threshold
+        and (typecode := typecode_of(xs)) is not None
+    ):
+        a = np.array(xs, dtype=np.int64 if typecode == "q" else np.float64)
+    else:
+        return None
+
+    # NaNs don't sort, in the pure paths either
+    if a.dtype.kind == "f" and np.isnan(a).any():
+        return None
+    return a
+
+
+def as_arrays(
+    xss: Sequence[Sequence], threshold: Optional[int] = None
+) -> Optional[List[Any]]:
+    """`as_array` for all of xss, if they all convert to the same dtype.
+
+    `threshold` applies to their total length.
+    """
+    if threshold is None:
+        threshold = NUMPY_THRESHOLD
+    if not xss or sum(map(len, xss)) < threshold:
+        return None
+    arrays = [as_array(xs, threshold=0) for xs in xss]
+    if any(a is None for a in arrays) or len({a.dtype for a in arrays}) > 1:
+        return None
+    return arrays
+
+
+def partition3(a: Any, pivot: Any) -> Tuple[int, int]:
+    """Three-way partition a in place; return the #smaller and #greater."""
+    lt, eq, gt = a < pivot, a == pivot, a > pivot
+    a[:] = np.concatenate((a[lt], a[eq], a[gt]))
+    return int(lt.sum()), int(gt.sum())
+
+
+def merge(a: Any, b: Any) -> Any:
+    """Stable merge of two sorted arrays, ties taken from a first."""
+    return _merge_at(a, b, np.searchsorted(a, b, side="right"))
+
+
+def _merge_at(a: Any, b: Any, b_after: Any) -> Any:
+    """Merge, given how many values of a every value of b goes after."""
+    out = np.empty(len(a) + len(b), dtype=np.result_type(a, b))
+    # every b lands after the a's not greater than it, and the b's before it
+    at = b_after + np.arange(len(b))
+    taken = np.zeros(len(out), dtype=bool)
+    taken[at] = True
+    out[at], out[~taken] = b, a
+    return out
+
+
+def merge_sort(a: Any, block: int = BLOCK) -> Any:
+    """Stable sort: sort blocks, then merge them pairwise, level by level."""
+    runs = [
+        np.sort(a[i : i + block], kind="stable")
+        for i in range(0, len(a), block)
+    ]
+    while len(runs) > 1:
+        runs = [
+            merge(runs[i], runs[i + 1]) if i + 1 < len(runs) else runs[i]
+            for i in range(0, len(runs), 2)
+        ]
+    return runs[0] if runs else a[:0].copy()
+
+
+def merge_count(runs: Sequence[Any]) -> Tuple[Any, int]:
+    """Stable merge of sorted arrays, in order; return it and #inversions.
+
+    Only pairs across runs count: the greater element in an earlier run.
+    Runs get merged pairwise, level by level.
+    """
+    _runs, total = list(runs), 0
+    while len(_runs) > 1:
+        merged = []
+        for a, b in zip(_runs[::2], _runs[1::2]):
+            # every value of b is less than the values of a right of it
+            b_after = np.searchsorted(a, b, side="right")
+            total += len(a) * len(b) - int(b_after.sum())
+            merged.append(_merge_at(a, b, b_after))
+        _runs = merged + _runs[len(merged) * 2 :]
+    return _runs[0], total
+
+
+def sort_buffer(xs: array) -> None:
+    """Sort an array of "q"s or "d"s in place, without extra memory."""
+    np.frombuffer(xs, dtype=xs.typecode).sort()
+
+
+def inv_count(a: Any) -> int:
+    """Count the pairs i < j with a[i] > a[j]."""
+    n = len(a)
+    if n < 2:
+        return 0
+
+    # dense ranks => equal values compare equal, and keys fit in int64
+    order = np.argsort(a, kind="stable")
+    new_key = np.empty(n, dtype=bool)
+    new_key[0], new_key[1:] = True, a[order[1:]] != a[order[:-1]]
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[order] = np.cumsum(new_key) - 1
+
+    pos, total, width = np.arange(n, dtype=np.int64), 0, 1
+    while width < n:
+        # runs of `width` are sorted => merge pairs of them, keyed by pair
+        pair_start = pos - pos % (2 * width)
+        order = np.argsort(pair_start * n + ranks, kind="stable")
+        merged_at = np.empty(n, dtype=np.int64)
+        merged_at[order] = pos
+
+        # a right run element merged at offset m, j-th in its run, went
+        # past m - j left elements => the other width - (m - j) are greater
+        right = pos % (2 * width) >= width
+        j = pos[right] - pair_start[right] - width
+        total += int(
+            (width - (merged_at[right] - pair_start[right] - j)).sum()
+        )
+
+        ranks = ranks[order]
+        width *= 2
+    return total